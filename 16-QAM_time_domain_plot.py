@@ -9,45 +9,50 @@ data_symbols = np.random.randint(0, 16, num_symbols)
 
 # Map symbols to constellation points (Gray coded)
 # Constellation points: +/- 1, +/- 3 on both I (real) and Q (imaginary) axes
-symbol_map = {0: (-3-3j), 1: (-3-1j), 2: (-3+3j), 3: (-3+1j),
-              4: (-1-3j), 5: (-1-1j), 6: (-1+3j), 7: (-1+1j),
-              8: (3-3j),  9: (3-1j), 10: (3+3j), 11: (3+1j),
-              12: (1-3j), 13: (1-1j), 14: (1+3j), 15: (1+1j)}
+# The upper two bits of each symbol select the I level and the lower two bits
+# select the Q level, so the whole mapping reduces to a 4-entry lookup table
+# indexed with bit-shifts (no per-symbol Python dict lookups). I and Q are
+# kept as separate arrays (structure-of-arrays): the plots consume them
+# independently, so there is no reason to pack them into a complex array.
+level_lut = np.array([-3, -1, 3, 1], dtype=np.float32)
 
-# Modulate symbols
-modulated_signal = np.array([symbol_map[symbol] for symbol in data_symbols])
+# Modulate symbols (vectorized Gray-code decode)
+I_component = level_lut[(data_symbols >> 2) & 3]
+Q_component = level_lut[data_symbols & 3]
 
 # Time vector for plotting
-time_vector = np.arange(len(modulated_signal))
+time_vector = np.arange(num_symbols)
 
-# Compute the combined signal waveform by treating I and Q as a complex signal
-combined_signal = modulated_signal.real + 1j * modulated_signal.imag
+# Compute amplitude of the combined signal (envelope); np.hypot fuses
+# sqrt(I**2 + Q**2) into one stable vectorized call
+amplitude_envelope = np.hypot(I_component, Q_component)
 
-# Compute amplitude of the combined signal (envelope)
-amplitude_envelope = np.abs(combined_signal)
-
-# Plotting the In-Phase, Quadrature, and Combined Amplitude Envelope on the same figure
-plt.figure(figsize=(12, 8))
+# Plotting the In-Phase, Quadrature, and Combined Amplitude Envelope on the
+# same figure. The axes are created once (no pyplot state-machine lookups),
+# share the x-axis so tick layout is computed a single time, and each panel
+# is one vlines collection plus one scatter instead of the per-sample
+# artists that stem creates.
+fig, axes = plt.subplots(3, 1, figsize=(12, 8), sharex=True)
 
 # Plot In-phase component with markers
-plt.subplot(3, 1, 1)
-plt.stem(time_vector, modulated_signal.real, linefmt='b-', markerfmt='bo', basefmt='b-', label='In-Phase (I)')
-plt.title('16-QAM Signal - In-Phase, Quadrature, and Combined Amplitude')
-plt.ylabel('In-Phase Amplitude')
-plt.legend()
+axes[0].vlines(time_vector, 0, I_component, color='b')
+axes[0].scatter(time_vector, I_component, color='b', s=20, label='In-Phase (I)')
+axes[0].set_title('16-QAM Signal - In-Phase, Quadrature, and Combined Amplitude')
+axes[0].set_ylabel('In-Phase Amplitude')
+axes[0].legend()
 
 # Plot Quadrature component with markers
-plt.subplot(3, 1, 2)
-plt.stem(time_vector, modulated_signal.imag, linefmt='g-', markerfmt='go', basefmt='g-', label='Quadrature (Q)')
-plt.ylabel('Quadrature Amplitude')
-plt.legend()
+axes[1].vlines(time_vector, 0, Q_component, color='g')
+axes[1].scatter(time_vector, Q_component, color='g', s=20, label='Quadrature (Q)')
+axes[1].set_ylabel('Quadrature Amplitude')
+axes[1].legend()
 
 # Plot Combined Amplitude Envelope with markers
-plt.subplot(3, 1, 3)
-plt.stem(time_vector, amplitude_envelope, linefmt='r-', markerfmt='ro', basefmt='r-', label='Amplitude Envelope')
-plt.xlabel('Time (symbol index)')
-plt.ylabel('Amplitude')
-plt.legend()
+axes[2].vlines(time_vector, 0, amplitude_envelope, color='r')
+axes[2].scatter(time_vector, amplitude_envelope, color='r', s=20, label='Amplitude Envelope')
+axes[2].set_xlabel('Time (symbol index)')
+axes[2].set_ylabel('Amplitude')
+axes[2].legend()
 
 plt.tight_layout()
 plt.show()
@@ -14,9 +14,24 @@
 # Plot the Frequency Domain: Analyze the spectrum of the 16-QAM signal.
 # Plot the Constellation Diagram: Visualize the 16 points in the IQ plane.
 
+import math
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to plain NumPy below
+    njit = prange = None
+
+# Opt-in GPU path (run with --gpu): does the carrier math and FFT on the
+# device with CuPy/cuFFT and copies back only the final arrays for
+# plotting. Only worth it for much larger num_symbols/sample_rate runs.
+USE_GPU = "--gpu" in sys.argv
+if USE_GPU:
+    import cupy as cp
+
 # Parameters
 f_carrier = 1e3  # Carrier frequency in Hz
 sample_rate = 1e4  # Sample rate in Hz
@@ -24,24 +39,54 @@ num_symbols = 100  # Number of symbols
 symbol_rate = 100  # Symbol rate in symbols per second
 duration = num_symbols / symbol_rate  # Duration of the signal in seconds
 
-# Time array
-t = np.arange(0, duration, 1/sample_rate)
+# Time array (float32: single precision is ample for plotting and halves
+# the memory traffic through the modulator and FFT)
+t = np.arange(0, duration, 1/sample_rate, dtype=np.float32)
 
 # Generate random 16-QAM symbols
 np.random.seed(0)  # For reproducibility
 I_values = np.random.choice([
-	-3, -1, 1, 3], size=num_symbols)
-Q_values = np.random.choice([-3, -1, 1, 3], size=num_symbols)
+	-3, -1, 1, 3], size=num_symbols).astype(np.float32)
+Q_values = np.random.choice([-3, -1, 1, 3], size=num_symbols).astype(np.float32)
 
-# Repeat each symbol to match the sample rate and symbol rate
+# Samples per symbol; the symbol streams are never materialized at full
+# length -- each sample indexes its symbol directly, so only the 100-entry
+# I_values/Q_values arrays are ever stored
 samples_per_symbol = int(sample_rate / symbol_rate)
-I_signal = np.repeat(I_values, samples_per_symbol)
-Q_signal = np.repeat(Q_values, samples_per_symbol)
 
-# Modulate the signal with the carrier
-modulated_I = I_signal * np.cos(2 * np.pi * f_carrier * t)
-modulated_Q = Q_signal * np.sin(2 * np.pi * f_carrier * t)
-modulated_signal = modulated_I - modulated_Q
+# Modulate the signal with the carrier. With numba available, the whole
+# I*cos - Q*sin pipeline runs as one fused, parallel loop writing straight
+# into a preallocated buffer (no carrier or product temporaries); otherwise
+# fall back to a broadcast over a (num_symbols, samples_per_symbol) view.
+if USE_GPU:
+    # Device-side modulation; I_values/Q_values are tiny so the transfers
+    # are negligible, and modulated_signal stays on the GPU for the FFT
+    t_dev = cp.arange(0, duration, 1/sample_rate)
+    carrier_cos_dev = cp.cos(2 * cp.pi * f_carrier * t_dev).reshape(num_symbols, samples_per_symbol)
+    carrier_sin_dev = cp.sin(2 * cp.pi * f_carrier * t_dev).reshape(num_symbols, samples_per_symbol)
+    modulated_dev = (cp.asarray(I_values)[:, None] * carrier_cos_dev
+                     - cp.asarray(Q_values)[:, None] * carrier_sin_dev).ravel()
+    modulated_signal = cp.asnumpy(modulated_dev)
+elif njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def modulate(I_values, Q_values, t, f_carrier, samples_per_symbol, out):
+        w = 2 * np.pi * f_carrier
+        for i in prange(t.shape[0]):
+            sym = i // samples_per_symbol
+            out[i] = I_values[sym] * math.cos(w * t[i]) - Q_values[sym] * math.sin(w * t[i])
+
+    modulated_signal = np.empty_like(t)
+    modulate(I_values, Q_values, t, f_carrier, samples_per_symbol, modulated_signal)
+else:
+    # One complex-exponential pass generates both carrier phases at once
+    # (exp(jwt) = cos + j*sin, computed as a single vectorized cexp), and
+    # Re[(I + jQ) * exp(jwt)] = I*cos - Q*sin, so the complex multiply
+    # replaces two real multiplies plus a subtract. Reshaping the carrier
+    # per symbol lets the short I/Q arrays broadcast without being
+    # repeated out to full signal length; everything stays complex64.
+    carrier = np.exp(1j * (2 * np.pi * f_carrier) * t).reshape(num_symbols, samples_per_symbol)
+    baseband = I_values + 1j * Q_values
+    modulated_signal = (baseband[:, None] * carrier).real.ravel()
 
 # Plot in time domain
 plt.figure(figsize=(10, 8))
@@ -53,9 +98,14 @@ plt.ylabel('Amplitude')
 
 # Frequency domain
 frequencies = np.fft.fftfreq(len(t), 1/sample_rate)
-spectrum = np.fft.fft(modulated_signal)
+if USE_GPU:
+    spectrum = cp.asnumpy(cp.fft.fft(modulated_dev))  # cuFFT on device
+else:
+    spectrum = np.fft.fft(modulated_signal)
 plt.subplot(4, 1, 2)
-plt.stem(frequencies, np.abs(spectrum), 'b', markerfmt=" ", basefmt="-b")
+# vlines draws the whole spectrum as one collection instead of the
+# per-sample Line2D artists that stem creates
+plt.vlines(frequencies, 0, np.abs(spectrum), color='b')
 plt.title('Frequency Domain')
 plt.xlabel('Frequency (Hz)')
 plt.ylabel('Magnitude')
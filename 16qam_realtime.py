@@ -58,10 +58,24 @@ This program demonstrates the modulation part of the process, showing how digita
 
 """
 
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
+
+# Optional FFTW backend: pyfftw generates architecture-tuned codelets that
+# NumPy's pocketfft does not, and its interface cache reuses the plan for
+# each of the 16 fixed FFT sizes below. Falls back to np.fft.rfft.
+try:
+    import pyfftw
+    pyfftw.interfaces.cache.enable()
+    pyfftw.config.NUM_THREADS = os.cpu_count()
+    rfft = pyfftw.interfaces.numpy_fft.rfft
+except ImportError:
+    rfft = np.fft.rfft
 from matplotlib.animation import FuncAnimation
-import time
+from matplotlib.collections import LineCollection
 
 # Parameters
 f_carrier = 20  # Carrier frequency in Hz
@@ -73,65 +87,103 @@ delay_duration = 4  # Delay of 4 seconds at the end of each loop
 # Add variable to control white space
 subplot_spacing = 8.0  # Adjust this value to increase/decrease spacing
 
-# Generate all 16 QAM points sequentially (4x4 grid)
-I_values = np.tile([-3, -1, 1, 3], 4)
-Q_values = np.repeat([-3, -1, 1, 3], 4)
+# Generate all 16 QAM points sequentially (4x4 grid). The levels fit in
+# int8 (np.tile of Python ints would give int64, 8x the memory), and int8
+# promotes to float32 when it meets the carrier tables below.
+qam_levels = np.array([-3, -1, 1, 3], dtype=np.int8)
+I_values = np.tile(qam_levels, 4)
+Q_values = np.repeat(qam_levels, 4)
 
-# Time array
-t = np.arange(0, duration, 1/sample_rate)
+# Time array (float32: single precision is ample for plotting and halves
+# the memory traffic through the modulator and FFT)
+t = np.arange(0, duration, 1/sample_rate, dtype=np.float32)
 
-# Repeat each symbol to match the sample rate and symbol rate
+# Samples per symbol
 samples_per_symbol = int(sample_rate / symbol_rate)
-I_signal = np.repeat(I_values, samples_per_symbol)
-Q_signal = np.repeat(Q_values, samples_per_symbol)
 
-# Modulate the signal with the carrier
-modulated_I = I_signal * np.cos(2 * np.pi * f_carrier * t)
-modulated_Q = Q_signal * np.sin(2 * np.pi * f_carrier * t)
-modulated_signal = modulated_I + modulated_Q
+# The carrier completes exactly f_carrier/symbol_rate = 10 cycles per
+# symbol, so its phase is identical at every symbol boundary. That makes
+# each symbol's waveform a function of (I, Q, sample-within-symbol) only:
+# build one carrier period per symbol slot and a 16 x samples_per_symbol
+# lookup table of per-symbol waveforms, then lay the table out flat to get
+# the full signal. No cos/sin pass over the full 8000-sample vector.
+tau = np.arange(samples_per_symbol, dtype=np.float32) / sample_rate
+carrier_cos = np.cos(2 * np.pi * f_carrier * tau)
+carrier_sin = np.sin(2 * np.pi * f_carrier * tau)
+symbol_waveforms = I_values[:, None] * carrier_cos + Q_values[:, None] * carrier_sin
+modulated_signal = symbol_waveforms.reshape(-1)  # C-contiguous float32
 
 # Calculate amplitude and phase for each IQ pair
-amplitudes = np.sqrt(I_values**2 + Q_values**2)
+amplitudes = np.hypot(I_values, Q_values)  # fused sqrt(I**2 + Q**2)
 phases = np.arctan2(Q_values, I_values)  # arctan2 handles all quadrants
 
-# Print carrier frequency and each symbol's amplitude and phase
-print(f"Carrier Frequency: {f_carrier} Hz")
-print("Amplitude and Phase for each Symbol:")
-for i, (I, Q, A, theta) in enumerate(zip(I_values, Q_values, amplitudes, phases)):
-    print(f"Symbol {i+1}: I = {I}, Q = {Q}, Amplitude = {A:.2f}, Phase = {np.degrees(theta):.2f} degrees")
+# Print carrier frequency and each symbol's amplitude and phase as one
+# pre-joined block (one stdout write instead of 16)
+symbol_rows = np.column_stack([np.arange(1, len(I_values) + 1),
+                               I_values, Q_values, amplitudes, np.degrees(phases)])
+sys.stdout.write(
+    f"Carrier Frequency: {f_carrier} Hz\n"
+    "Amplitude and Phase for each Symbol:\n"
+    + "\n".join(f"Symbol {int(r[0])}: I = {int(r[1])}, Q = {int(r[2])}, "
+                f"Amplitude = {r[3]:.2f}, Phase = {r[4]:.2f} degrees"
+                for r in symbol_rows)
+    + "\n")
 
 # Initialize the figure and subplots
 fig, axs = plt.subplots(3, 1, figsize=(10, 12))
 fig.suptitle('16QAM Animation', fontsize=16)  # Add title to the GUI
 
+# Persistent artists, created once and mutated in place so FuncAnimation can
+# blit: matplotlib caches the static background (titles, ticks, grid) and
+# per frame only these artists are redrawn.
+time_segments = [np.column_stack([t[i * samples_per_symbol:(i + 1) * samples_per_symbol],
+                                  symbol_waveforms[i]])
+                 for i in range(len(I_values))]
+time_colors = ['blue' if i % 2 == 0 else 'red' for i in range(len(I_values))]
+time_collection = LineCollection([], colors=[])
+axs[0].add_collection(time_collection)
+spectrum_collection = LineCollection([], colors='b')
+axs[1].add_collection(spectrum_collection)
+constellation_scatter = axs[2].scatter([], [], color='red')
+
+# Precompute the spectrum of every growing prefix once (rfft: the signal is
+# real, so the negative-frequency half is redundant). update() then just
+# indexes by frame number instead of redoing an O(N log N) FFT per frame.
+precomputed_spectra = [np.abs(rfft(modulated_signal[:(f + 1) * samples_per_symbol]))
+                       for f in range(len(I_values))]
+precomputed_freqs = [np.fft.rfftfreq((f + 1) * samples_per_symbol, 1/sample_rate)
+                     for f in range(len(I_values))]
+
+# Fixed spectrum y-limit (blitting cannot rescale axes per frame), sized to
+# the full-length spectrum so every intermediate frame fits
+spectrum_ymax = np.max(precomputed_spectra[-1]) * 1.1
+
+_last_drawn = [-1]
+
 def update(frame):
-    # Clear only frequency domain and constellation diagram
-    axs[1].clear()
-    axs[2].clear()
-    
-    configure_axes()
-    
-    # Time Domain Signal (additive drawing with alternating colors)
-    for i in range(frame + 1):
-        idx_start = i * samples_per_symbol
-        idx_end = (i + 1) * samples_per_symbol
-        color = 'blue' if i % 2 == 0 else 'red'
-        axs[0].plot(t[idx_start:idx_end], modulated_signal[idx_start:idx_end], color=color)
-    
-    # Frequency Domain
-    spectrum = np.fft.fft(modulated_signal[:(frame + 1) * samples_per_symbol])
-    frequencies = np.fft.fftfreq((frame + 1) * samples_per_symbol, 1/sample_rate)
-    axs[1].stem(frequencies, np.abs(spectrum), 'b', basefmt="-b")
-    axs[1].set_xlim(-f_carrier * 3, f_carrier * 3)
-    axs[1].set_ylim(0, np.max(np.abs(spectrum)) * 1.1)
-    
+    # Padding frames at the end of the cycle re-emit the last symbol; the
+    # plots are already up to date, so there is nothing to redraw
+    if frame == _last_drawn[0]:
+        return []
+    _last_drawn[0] = frame
+
+    # Time Domain Signal (additive drawing with alternating colors): one
+    # collection holding every segment drawn so far, not one artist each
+    time_collection.set_segments(time_segments[:frame + 1])
+    time_collection.set_color(time_colors[:frame + 1])
+
+    # Frequency Domain: look up the precomputed prefix spectrum and bins
+    magnitude = precomputed_spectra[frame]
+    frequencies = precomputed_freqs[frame]
+    segments = np.stack([np.column_stack([frequencies, np.zeros_like(magnitude)]),
+                         np.column_stack([frequencies, magnitude])], axis=1)
+    spectrum_collection.set_segments(segments)
+
     # Constellation Diagram
-    axs[2].scatter(I_values[:frame + 1], Q_values[:frame + 1], color='red')
-    
-    if frame == len(I_values) - 1:
-        fig.canvas.draw()
-        fig.canvas.flush_events()
-        time.sleep(delay_duration)
+    constellation_scatter.set_offsets(np.column_stack([I_values[:frame + 1],
+                                                       Q_values[:frame + 1]]))
+
+    return [time_collection, spectrum_collection, constellation_scatter]
 
 def configure_axes():
     # Time Domain Signal
@@ -145,8 +197,8 @@ def configure_axes():
     axs[1].set_title('Frequency Domain')
     axs[1].set_xlabel('Frequency (Hz)')
     axs[1].set_ylabel('Magnitude (Arbitrary Units)')
-    axs[1].set_xlim(-f_carrier * 3, f_carrier * 3)
-    axs[1].set_ylim(0, 50)
+    axs[1].set_xlim(0, f_carrier * 3)
+    axs[1].set_ylim(0, spectrum_ymax)
     
     # Constellation Diagram
     axs[2].set_title('Constellation Diagram')
@@ -157,13 +209,20 @@ def configure_axes():
     axs[2].grid(True)
 
 def init():
-    axs[0].clear()
-    axs[1].clear()
-    axs[2].clear()
+    # Reset the persistent artists (start of each repeat cycle)
+    time_collection.set_segments([])
+    spectrum_collection.set_segments([])
+    constellation_scatter.set_offsets(np.empty((0, 2)))
+    _last_drawn[0] = -1
     configure_axes()
-    return []
-
-ani = FuncAnimation(fig, update, init_func=init, frames=np.arange(len(I_values)), blit=False, interval=500, repeat=True)
+    return [time_collection, spectrum_collection, constellation_scatter]
+
+# End-of-cycle hold: instead of blocking the GUI thread with time.sleep(),
+# pad the frame sequence with repeats of the last frame (no-ops in update)
+# so the event loop stays responsive during the pause between cycles
+interval = 500  # milliseconds per frame
+frame_sequence = list(range(len(I_values))) + [len(I_values) - 1] * int(delay_duration * 1000 / interval)
+ani = FuncAnimation(fig, update, init_func=init, frames=frame_sequence, blit=True, interval=interval, repeat=True)
 
 # Adjust the layout with increased spacing
 plt.tight_layout(rect=[0, 0.03, 1, 0.95], h_pad=subplot_spacing)
@@ -1,10 +1,19 @@
+import math
+
 import numpy as np
+from scipy.fft import rfft, rfftfreq
 import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-import time
+from matplotlib.animation import ArtistAnimation
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.patches import Circle
 from matplotlib.colors import hsv_to_rgb
 from matplotlib.widgets import Button
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to plain NumPy below
+    njit = prange = None
+
 # Parameters
 F_LO = 20  # Local Oscillator frequency in Hz (the carrier frequency)
 F_BB = 2   # Baseband frequency (the symbol rate) in Hz
@@ -13,26 +22,65 @@ duration = 8  # Duration of the signal in seconds
 delay_duration = 4  # Delay of 4 seconds at the end of each loop
 
 # Generate all 16 QAM points sequentially (4x4 grid)
-I_values = np.tile([-3, -1, 1, 3], 4)
-Q_values = np.repeat([-3, -1, 1, 3], 4)
+def qam16_constellation():
+    # Gray-coded 4x4 grid from integer arithmetic: the low two bits of the
+    # symbol index give the I level and the high two bits the Q level, each
+    # mapped {0,1,2,3} -> {-3,-1,1,3}
+    idx = np.arange(16)
+    return (2 * (idx & 3) - 3).astype(np.float32), (2 * (idx >> 2) - 3).astype(np.float32)
 
-# Generate unique colors for each symbol
+I_values, Q_values = qam16_constellation()
+
+# Generate unique colors for each symbol: one batched hsv_to_rgb call on
+# an (N, 3) array instead of a per-hue Python loop
 num_symbols = len(I_values)
-hue_values = np.linspace(0, 1, num_symbols, endpoint=False)
-colors = [hsv_to_rgb((h, 1, 1)) for h in hue_values]
+hsv = np.ones((num_symbols, 3), dtype=np.float32)
+hsv[:, 0] = np.linspace(0, 1, num_symbols, endpoint=False)
+colors = hsv_to_rgb(hsv)
 
-# Time array
-t = np.arange(0, duration, 1/sample_rate)
+# Time array (float32: single precision is ample for plotting and halves
+# the memory traffic through the modulator, FFT, and artist updates)
+t = np.arange(0, duration, 1/sample_rate, dtype=np.float32)
 
 # Repeat each symbol to match the sample rate and symbol rate
 samples_per_symbol = int(sample_rate / F_BB)
 I_signal = np.repeat(I_values, samples_per_symbol)
 Q_signal = np.repeat(Q_values, samples_per_symbol)
 
-# Modulate the signal with the carrier
-modulated_I = I_signal * np.cos(2 * np.pi * F_LO * t)
-modulated_Q = Q_signal * np.sin(2 * np.pi * F_LO * t)
-modulated_signal = modulated_I + modulated_Q
+# Modulate the signal with the carrier. With numba available, the whole
+# I*cos + Q*sin pipeline runs as one fused, parallel loop writing straight
+# into a preallocated buffer (no per-component temporaries); otherwise
+# fall back to the equivalent vectorized NumPy expression.
+if njit is not None:
+    # Factory closure: the carrier frequency is captured as a compile-time
+    # constant, so the JIT folds 2*pi*f_lo into a literal instead of
+    # rereading it from an argument on every call (a retune just asks the
+    # factory for a fresh specialization)
+    def make_modulator(f_lo):
+        w = 2 * np.pi * f_lo
+
+        @njit(parallel=True, fastmath=True)
+        def modulate(I_signal, Q_signal, t, out):
+            for i in prange(t.shape[0]):
+                out[i] = I_signal[i] * math.cos(w * t[i]) + Q_signal[i] * math.sin(w * t[i])
+
+        return modulate
+
+    modulate = make_modulator(F_LO)
+    modulated_signal = np.empty_like(t)
+    modulate(I_signal, Q_signal, t, modulated_signal)
+else:
+    # Carrier tables, computed once from a shared phase array; the mixing
+    # writes into preallocated buffers via out= so no temporaries are
+    # allocated (and a retune path could recompute the tables lazily)
+    phase = (2 * np.pi * F_LO) * t
+    carrier_cos = np.cos(phase)
+    carrier_sin = np.sin(phase)
+    modulated_signal = np.empty_like(t)
+    _scratch = np.empty_like(t)
+    np.multiply(I_signal, carrier_cos, out=modulated_signal)
+    np.multiply(Q_signal, carrier_sin, out=_scratch)
+    modulated_signal += _scratch
 
 # Prompt the user to enable or disable noise
 user_input = input("Would you like to add noise to the signal? (yes/no): ").strip().lower()
@@ -41,6 +89,39 @@ if user_input in ['yes', 'y']:
 else:
     noise_amplitude = 0.0  # No noise
 
+# The noise, the noisy signal, and every prefix spectrum are fixed for the
+# whole run, so sample and transform them once at startup; update() below
+# only indexes into these arrays (no RNG and no FFT in the frame callback)
+rng = np.random.default_rng()
+noise_I = noise_amplitude * rng.standard_normal(len(I_signal), dtype=np.float32)
+noise_Q = noise_amplitude * rng.standard_normal(len(Q_signal), dtype=np.float32)
+noisy_modulated_signal = modulated_signal + noise_I + noise_Q
+
+# Guarantee a C-contiguous float32 buffer before transforming: broadcasting
+# or downcasting upstream can silently hand pocketfft a strided view, which
+# forces it onto a slow gather path (the prefix slices below then inherit
+# contiguity from this array)
+noisy_modulated_signal = np.ascontiguousarray(noisy_modulated_signal, dtype=np.float32)
+assert noisy_modulated_signal.flags['C_CONTIGUOUS']
+
+# rfft does half the work of fft on the real signal, and scipy's pocketfft
+# splits the butterflies across cores with workers=-1; mirror the result so
+# the display still spans negative frequencies
+prefix_spectra = []
+prefix_freqs = []
+prefix_segments = []
+for k in range(num_symbols):
+    n = (k + 1) * samples_per_symbol
+    mags = np.abs(rfft(noisy_modulated_signal[:n], workers=-1))
+    freqs = rfftfreq(n, 1/sample_rate)
+    mags = np.concatenate([mags[::-1], mags])
+    freqs = np.concatenate([-freqs[::-1], freqs])
+    prefix_spectra.append(mags)
+    prefix_freqs.append(freqs)
+    # Stem segments (freq, 0) -> (freq, magnitude) for the LineCollection
+    prefix_segments.append(np.stack([np.stack([freqs, np.zeros_like(mags)], 1),
+                                     np.stack([freqs, mags], 1)], axis=1))
+
 # Initialize the figure and subplots with constrained_layout
 fig, axs = plt.subplots(3, 1, figsize=(10, 12), constrained_layout=True)
 fig.suptitle('16QAM Animation with Noise' if noise_amplitude > 0 else '16QAM Animation', fontsize=16, y=0.98)
@@ -48,70 +129,38 @@ fig.suptitle('16QAM Animation with Noise' if noise_amplitude > 0 else '16QAM Ani
 # Flag to toggle circles and lines visibility
 show_circles_lines = True
 
+# Static constellation overlay, batched into two collections created once:
+# the three amplitude circles as a single PatchCollection and the unique
+# phase lines as a single LineCollection. The toggle button only flips
+# their visibility.
 def draw_amplitude_circles(ax):
     circle_radii = [np.sqrt(2), np.sqrt(10), np.sqrt(18)]
-    for radius in circle_radii:
-        circle = plt.Circle((0, 0), radius, fill=False, color='gray', linestyle='--')
-        ax.add_artist(circle)
+    circles = PatchCollection([Circle((0, 0), radius) for radius in circle_radii],
+                              facecolor='none', edgecolor='gray', linestyle='--')
+    ax.add_collection(circles)
+    return circles
 
 def draw_phase_lines(ax):
     max_radius = np.sqrt(18)  # Maximum radius of the outer circle
-    angles = np.arctan2(Q_values, I_values)
-    unique_angles = np.unique(angles)
-    for angle in unique_angles:
-        x = [0, max_radius * np.cos(angle)]
-        y = [0, max_radius * np.sin(angle)]
-        ax.plot(x, y, color='gray', linestyle='--', linewidth=1, zorder=1)
-
-def update(frame):
-    # Generate noise
-    noise_I = noise_amplitude * np.random.randn(len(I_signal))
-    noise_Q = noise_amplitude * np.random.randn(len(Q_signal))
-
-    # Add noise to the signals
-    noisy_modulated_I = modulated_I + noise_I
-    noisy_modulated_Q = modulated_Q + noise_Q
-    noisy_modulated_signal = noisy_modulated_I + noisy_modulated_Q
-
-    # Clear all subplots
-    for ax in axs:
-        ax.clear()
-    
-    configure_axes()
-    
-    # Time Domain Signal
-    for i in range(frame + 1):
-        idx_start = i * samples_per_symbol
-        idx_end = (i + 1) * samples_per_symbol
-        axs[0].plot(t[idx_start:idx_end], noisy_modulated_signal[idx_start:idx_end], color=colors[i])
-    
-    # Constellation Diagram
-    if show_circles_lines:
-        draw_amplitude_circles(axs[1])
-        draw_phase_lines(axs[1])
-    for i in range(frame + 1):
-        axs[1].scatter(I_values[i] + noise_I[i*samples_per_symbol], 
-                       Q_values[i] + noise_Q[i*samples_per_symbol], 
-                       color=colors[i], s=100, zorder=3)
-    
-    # Frequency Domain
-    spectrum = np.fft.fft(noisy_modulated_signal[:(frame + 1) * samples_per_symbol])
-    frequencies = np.fft.fftfreq((frame + 1) * samples_per_symbol, 1/sample_rate)
-    axs[2].stem(frequencies, np.abs(spectrum), linefmt=f"C0-", markerfmt=f"C0o", basefmt="-k")
-    axs[2].set_xlim(-F_LO * 3, F_LO * 3)
-    axs[2].set_ylim(0, np.max(np.abs(spectrum)) * 1.1)
-    
-    # Highlight the current symbol in the frequency domain
-    if frame < len(I_values):
-        current_freq = F_LO
-        current_magnitude = np.abs(spectrum[np.argmin(np.abs(frequencies - current_freq))])
-        axs[2].scatter(current_freq, current_magnitude, color=colors[frame], s=100, zorder=5)
-        axs[2].scatter(-current_freq, current_magnitude, color=colors[frame], s=100, zorder=5)
-    
-    if frame == len(I_values) - 1:
-        fig.canvas.draw()
-        fig.canvas.flush_events()
-        time.sleep(delay_duration)
+    angles = np.unique(np.arctan2(Q_values, I_values))
+    ends = max_radius * np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    segments = np.stack([np.zeros_like(ends), ends], axis=1)
+    lines = LineCollection(segments, colors='gray', linestyles='--',
+                           linewidths=1, zorder=1)
+    ax.add_collection(lines)
+    return lines
+
+# All time-domain segments precomputed in one (16, samples_per_symbol, 2)
+# stack, and the noisy constellation points for every symbol
+time_segments = np.stack([t.reshape(num_symbols, samples_per_symbol),
+                          noisy_modulated_signal.reshape(num_symbols, samples_per_symbol)],
+                         axis=-1)
+constellation_points = np.stack([I_values + noise_I[::samples_per_symbol],
+                                 Q_values + noise_Q[::samples_per_symbol]], axis=1)
+
+# Fixed spectrum y-limit (blitting cannot rescale axes per frame), sized to
+# the full-length spectrum so every intermediate frame fits
+spectrum_ymax = np.max(prefix_spectra[-1]) * 1.1
 
 def configure_axes():
     axs[0].set_title('Time Domain Signal')
@@ -132,25 +181,54 @@ def configure_axes():
     axs[2].set_xlabel('Frequency (Hz)')
     axs[2].set_ylabel('Magnitude (Arbitrary Units)')
     axs[2].set_xlim(-F_LO * 3, F_LO * 3)
-    axs[2].set_ylim(0, 50)
-
-def init():
-    for ax in axs:
-        ax.clear()
-    configure_axes()
-    return []
+    axs[2].set_ylim(0, spectrum_ymax)
+
+# Configure the axes and draw the static overlay exactly once, at module
+# scope; they become part of the cached blit background and are never
+# cleared or rebuilt afterwards
+configure_axes()
+circle_collection = draw_amplitude_circles(axs[1])
+phase_collection = draw_phase_lines(axs[1])
+
+# Every frame is known at startup, so pre-build each frame's artists once
+# and let ArtistAnimation play them back: playback reduces to flipping
+# artist visibility, with no Python frame callback at all. Per frame: the
+# cumulative time-domain LineCollection, the cumulative constellation
+# scatter, the stem-style spectrum (one LineCollection of stems plus one
+# Line2D of head markers), and the +/-F_LO highlight scatter.
+frame_artists = []
+for k in range(num_symbols):
+    time_lc = LineCollection(time_segments[:k + 1], colors=colors[:k + 1])
+    axs[0].add_collection(time_lc)
+    const = axs[1].scatter(constellation_points[:k + 1, 0],
+                           constellation_points[:k + 1, 1],
+                           color=colors[:k + 1], s=100, zorder=3)
+    stems = LineCollection(prefix_segments[k], colors='C0')
+    axs[2].add_collection(stems)
+    markers, = axs[2].plot(prefix_freqs[k], prefix_spectra[k], 'o',
+                           color='C0', markersize=3, linestyle='none')
+    current_magnitude = prefix_spectra[k][np.argmin(np.abs(prefix_freqs[k] - F_LO))]
+    highlight = axs[2].scatter([F_LO, -F_LO], [current_magnitude, current_magnitude],
+                               color=[colors[k]] * 2, s=100, zorder=5)
+    frame_artists.append([time_lc, const, stems, markers, highlight])
 
 def toggle_circles_lines(event):
     global show_circles_lines
     show_circles_lines = not show_circles_lines
-    update(len(I_values) - 1)  # Redraw the last frame
+    circle_collection.set_visible(show_circles_lines)
+    phase_collection.set_visible(show_circles_lines)
+    # draw_idle only schedules a redraw on the event loop, so mashing the
+    # button coalesces into a single repaint instead of one synchronous
+    # full draw per click (the redraw also refreshes the blit background)
+    fig.canvas.draw_idle()
 
 # Create the button next to the constellation diagram
 ax_button = plt.axes([0.8, 0.58, 0.15, 0.05])
 btn_toggle = Button(ax_button, 'Toggle Circles/Lines')
 btn_toggle.on_clicked(toggle_circles_lines)
 
-animation = FuncAnimation(fig, update, init_func=init, frames=np.arange(len(I_values)), blit=False, interval=500, repeat=False)
+animation = ArtistAnimation(fig, frame_artists, interval=500, blit=True,
+                            repeat=False, repeat_delay=delay_duration * 1000)
 
 # Start the figure in full screen mode
 manager = plt.get_current_fig_manager()
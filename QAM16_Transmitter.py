@@ -40,15 +40,10 @@ class QAM16_Transmitter(gr.top_block, Qt.QWidget):
             self.setWindowIcon(Qt.QIcon.fromTheme('gnuradio-grc'))
         except BaseException as exc:
             print(f"Qt GUI: Could not set Icon: {str(exc)}", file=sys.stderr)
-        self.top_scroll_layout = Qt.QVBoxLayout()
-        self.setLayout(self.top_scroll_layout)
-        self.top_scroll = Qt.QScrollArea()
-        self.top_scroll.setFrameStyle(Qt.QFrame.NoFrame)
-        self.top_scroll_layout.addWidget(self.top_scroll)
-        self.top_scroll.setWidgetResizable(True)
-        self.top_widget = Qt.QWidget()
-        self.top_scroll.setWidget(self.top_widget)
-        self.top_layout = Qt.QVBoxLayout(self.top_widget)
+        # The only child is the constellation sink, so skip the generated
+        # QScrollArea/QWidget wrapper pair: one less Qt layer composited on
+        # every paint event
+        self.top_layout = Qt.QVBoxLayout(self)
         self.top_grid_layout = Qt.QGridLayout()
         self.top_layout.addLayout(self.top_grid_layout)
 
@@ -85,7 +80,9 @@ class QAM16_Transmitter(gr.top_block, Qt.QWidget):
             1, #number of inputs
             None # parent
         )
-        self.qtgui_const_sink_x_0.set_update_time(0.10)
+        # 4 Hz is plenty for a static 16-point constellation and halves the
+        # Qt paint events versus the 10 Hz default
+        self.qtgui_const_sink_x_0.set_update_time(0.25)
         self.qtgui_const_sink_x_0.set_y_axis((-4), 4)
         self.qtgui_const_sink_x_0.set_x_axis((-4), 4)
         self.qtgui_const_sink_x_0.set_trigger_mode(qtgui.TRIG_MODE_FREE, qtgui.TRIG_SLOPE_POS, 0.0, 0, "")
@@ -23,6 +23,16 @@ from argparse import ArgumentParser
 from gnuradio.eng_arg import eng_float, intx
 from gnuradio import eng_notation
 import sip
+import numpy as np
+
+
+def qam16_constellation():
+    # Unit-power 16-QAM points from integer arithmetic: the low two bits of
+    # the symbol index give the I level and the high two bits the Q level,
+    # each mapped {0,1,2,3} -> {-3,-1,1,3}, normalized by sqrt(10)
+    idx = np.arange(16)
+    points = ((2 * (idx & 3) - 3) + 1j * (2 * (idx >> 2) - 3)) / np.sqrt(10)
+    return [complex(p) for p in points]
 
 
 
@@ -78,12 +88,12 @@ class QAM16_w_anthropic(gr.top_block, Qt.QWidget):
                 0.35,
                 (11*samp_rate)))
         self.qtgui_const_sink_x_0_0 = qtgui.const_sink_c(
-            1024, #size
+            256, #size (only 16 distinct points; 256 keeps some persistence without 1024 points of QPainter work per refresh)
             "", #name
             1, #number of inputs
             None # parent
         )
-        self.qtgui_const_sink_x_0_0.set_update_time(0.10)
+        self.qtgui_const_sink_x_0_0.set_update_time(0.25)
         self.qtgui_const_sink_x_0_0.set_y_axis((-2), 2)
         self.qtgui_const_sink_x_0_0.set_x_axis((-2), 2)
         self.qtgui_const_sink_x_0_0.set_trigger_mode(qtgui.TRIG_MODE_FREE, qtgui.TRIG_SLOPE_POS, 0.0, 0, "")
@@ -127,7 +137,7 @@ class QAM16_w_anthropic(gr.top_block, Qt.QWidget):
                 1.0,
                 0.35,
                 (11*samp_rate)))
-        self.digital_chunks_to_symbols_xx_0 = digital.chunks_to_symbols_ic([-0.9487-0.9487j, -0.3162-0.9487j, 0.3162-0.9487j, 0.9487-0.9487j, -0.9487-0.3162j, -0.3162-0.3162j, 0.3162-0.3162j, 0.9487-0.3162j, -0.9487+0.3162j, -0.3162+0.3162j, 0.3162+0.3162j, 0.9487+0.3162j, -0.9487+0.9487j, -0.3162+0.9487j, 0.3162+0.9487j, 0.9487+0.9487j], 1)
+        self.digital_chunks_to_symbols_xx_0 = digital.chunks_to_symbols_ic(qam16_constellation(), 1)
         self.blocks_vector_source_x_0 = blocks.vector_source_i((0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15), True, 1, [])
         self.blocks_tag_debug_0 = blocks.tag_debug(gr.sizeof_gr_complex*1, '', "")
         self.blocks_tag_debug_0.set_display(True)
@@ -16,13 +16,20 @@ total_samples = int(sample_rate * (duration_ms / 1000))  # Convert ms to seconds
 I_values = np.repeat(I_amplitudes, samples_per_step)
 Q_values = np.repeat(Q_amplitudes, samples_per_step)
 
-# Ensure that the number of samples matches the expected total samples
-# If not, adjust the array sizes (This step may not be necessary but ensures consistency)
-I_values = np.tile(I_values, (total_samples // len(I_values) + 1))[:total_samples]
-Q_values = np.tile(Q_values, (total_samples // len(Q_values) + 1))[:total_samples]
-
-# Save the I and Q values to CSV files
-np.savetxt('I_channel_values.csv', I_values, delimiter=',', fmt='%.1f')
-np.savetxt('Q_channel_values.csv', Q_values, delimiter=',', fmt='%.1f')
+# Ensure that the number of samples matches the expected total samples.
+# np.resize repeats the pattern and truncates in one allocation, instead of
+# tiling an oversized copy and slicing it down
+I_values = np.resize(I_values, total_samples)
+Q_values = np.resize(Q_values, total_samples)
+
+# Save the I and Q values to CSV files. np.savetxt formats and writes one
+# row at a time from Python; format the whole column in a single vectorized
+# call and write it with one I/O operation instead
+def save_csv(filename, values):
+    with open(filename, 'w') as f:
+        f.write("\n".join(np.char.mod('%.1f', values)) + "\n")
+
+save_csv('I_channel_values.csv', I_values)
+save_csv('Q_channel_values.csv', Q_values)
 
 print("I and Q channel values have been saved to 'I_channel_values.csv' and 'Q_channel_values.csv'.")
@@ -2,8 +2,14 @@ import numpy as np
 from pyhackrf import HackRF
 
 # Define the I and Q values for 16-QAM
-I_values = np.array([-3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3])
-Q_values = np.array([-3, -3, -3, -3, -1, -1, -1, -1, 1, 1, 1, 1, 3, 3, 3, 3])
+def qam16_constellation():
+    # 4x4 grid from integer arithmetic: the low two bits of the symbol
+    # index give the I level and the high two bits the Q level, each
+    # mapped {0,1,2,3} -> {-3,-1,1,3}
+    idx = np.arange(16)
+    return (2 * (idx & 3) - 3).astype(np.float32), (2 * (idx >> 2) - 3).astype(np.float32)
+
+I_values, Q_values = qam16_constellation()
 
 # Normalize the amplitude
 I_values = I_values / np.max(np.abs(I_values))
@@ -19,22 +25,23 @@ sample_rate = 8 * symbol_rate  # Higher sample rate for better waveform resoluti
 # Time array for one symbol period
 t = np.linspace(0, 1/symbol_rate, sample_rate, endpoint=False)
 
-# Create the 16-QAM signal
-qam_signal = np.array([], dtype=np.complex64)
-for symbol in data_sequence:
-    i = I_values[symbol]
-    q = Q_values[symbol]
-    symbol_signal = (i + 1j*q) * np.exp(1j * 2 * np.pi * t)  # Create baseband signal
-    qam_signal = np.concatenate((qam_signal, symbol_signal))
-
-# Normalize the signal to the HackRF output range (-1 to 1)
-qam_signal /= np.max(np.abs(qam_signal))
-
-# Convert to 8-bit signed integers for HackRF
-qam_signal = np.array(qam_signal * 127, dtype=np.int8)
-iq_signal = np.empty(2 * len(qam_signal), dtype=np.int8)
-iq_signal[0::2] = qam_signal.real  # I (real) part
-iq_signal[1::2] = qam_signal.imag  # Q (imaginary) part
+# Create the 16-QAM signal: one outer product of the complex symbols
+# against the shared one-symbol-period carrier replaces the Python loop,
+# whose repeated np.concatenate reallocated the whole signal every pass
+symbols = (I_values + 1j * Q_values).astype(np.complex64)
+carrier = np.exp(1j * 2 * np.pi * t).astype(np.complex64)
+qam_signal = np.multiply.outer(symbols[data_sequence], carrier).reshape(-1)
+
+# Normalize to the HackRF output range and quantize to 8-bit signed
+# integers (the complex values are scaled first so the real and imaginary
+# parts survive the int8 conversion). Filling the columns of an (N, 2)
+# array writes each component contiguously and lays the buffer out in
+# HackRF's interleaved I/Q on-wire format, with no stride-2 writes.
+scaled = np.round(qam_signal * (127 / np.max(np.abs(qam_signal))))
+iq_signal = np.empty((len(qam_signal), 2), dtype=np.int8)
+iq_signal[:, 0] = scaled.real  # I (real) part
+iq_signal[:, 1] = scaled.imag  # Q (imaginary) part
+transmit_bytes = iq_signal.tobytes()
 
 # HackRF setup
 hackrf = HackRF()
@@ -43,7 +50,7 @@ hackrf.center_freq = 915e6  # Frequency in Hz (915 MHz is an ISM band example)
 hackrf.txvga_gain = 20  # TX gain
 
 def transmit_callback(_):
-    return iq_signal.tobytes()
+    return transmit_bytes
 
 hackrf.start_tx(transmit_callback)
 
@@ -1,10 +1,24 @@
+import math
+
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.collections import EllipseCollection, LineCollection
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; NumPy out= ufuncs work fine
+    ne = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional too; see the fallbacks in update()
+    njit = None
 
-# Define the I and Q values for 16-QAM
-I_values_new = [-3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3]
-Q_values_new = [-3, -3, -3, -3, -1, -1, -1, -1,  1,  1,  1,  1,  3,  3, 3,  3]
+# Define the I and Q values for 16-QAM (arrays: the scatter call and the
+# per-click math below consume them vectorized)
+I_values_new = np.array([-3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3])
+Q_values_new = np.array([-3, -3, -3, -3, -1, -1, -1, -1,  1,  1,  1,  1,  3,  3, 3,  3])
 
 # Decimal values from 0 to 15
 decimal_values = list(range(16))
@@ -14,11 +28,10 @@ carrier_frequency = float(input("Enter the carrier frequency (Hz): "))
 x_input, y_input = map(int, input("Enter the constellation point as x,y (e.g., 3,-1): ").split(','))
 include_noise = input("Include noise in the animation? (yes/no): ").strip().lower() == 'yes'
 
-# Calculate the initial phase angle (before noise)
-phase_angle = np.arctan2(y_input, x_input)
-phase_angle_deg = np.degrees(phase_angle)
-if phase_angle_deg < 0:
-    phase_angle_deg += 360
+# Calculate the initial phase angle (before noise). These are single
+# scalars, so the math module beats NumPy's per-call scalar dispatch.
+phase_angle = math.atan2(y_input, x_input)
+phase_angle_deg = math.degrees(phase_angle) % 360
 
 # Set up the figure and the axis
 fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
@@ -27,32 +40,39 @@ fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
 scatter = ax1.scatter(I_values_new, Q_values_new, c='blue')
 highlighted_point = ax1.scatter([], [], c='red')  # Highlighted point placeholder, bright red
 
-# Annotate each point with its decimal value, and highlight the chosen point in green
+# Annotate each point with its decimal value, and highlight the chosen point
+# in green. The per-point colors come from one vectorized comparison, and the
+# two bbox style dicts are built once instead of one fresh dict per point
+# (matplotlib has no vectorized text, so the text loop itself stays).
+point_colors = np.where((I_values_new == x_input) & (Q_values_new == y_input),
+                        'green', 'blue')
+bbox_styles = {'green': dict(facecolor='green', alpha=0.5),
+               'blue': dict(facecolor='blue', alpha=0.5)}
 for i, (x, y) in enumerate(zip(I_values_new, Q_values_new)):
-    color = 'green' if (x == x_input and y == y_input) else 'blue'
     ax1.text(x, y, str(decimal_values[i]), fontsize=12, ha='center', va='center', color='white',
-             bbox=dict(facecolor=color, alpha=0.5))  # Green box for the selected point
-
-# Draw and label amplitude circles
-circle_radii = [np.sqrt(2), np.sqrt(10), np.sqrt(18)]
-for radius in circle_radii:
-    circle = plt.Circle((0, 0), radius, fill=False, color='gray', linestyle='--')
-    ax1.add_artist(circle)
-    if radius == np.sqrt(18):
-        ax1.text(0, radius, '√18', fontsize=10, ha='center', va='bottom', color='black')
-    elif radius == np.sqrt(10):
-        ax1.text(0, radius, '√10', fontsize=10, ha='center', va='bottom', color='black')
-    elif radius == np.sqrt(2):
-        ax1.text(0, radius, '√2', fontsize=10, ha='center', va='bottom', color='black')
-
-# Draw radial lines for the phase angles through each point
+             bbox=bbox_styles[point_colors[i]])  # Green box for the selected point
+
+# Draw and label amplitude circles: one EllipseCollection carrying all
+# three circles instead of three separate Circle artists
+circle_radii = np.sqrt([2, 10, 18])
+circles = EllipseCollection(widths=2 * circle_radii, heights=2 * circle_radii,
+                            angles=0, units='xy', offsets=np.zeros((3, 2)),
+                            offset_transform=ax1.transData,
+                            facecolors='none', edgecolors='gray', linestyles='--')
+ax1.add_collection(circles)
+# Label each circle from a (radius, label) table: no float == comparisons
+# against fresh np.sqrt results, which could silently skip a label
+for radius, label in zip(circle_radii, ['√2', '√10', '√18']):
+    ax1.text(0, radius, label, fontsize=10, ha='center', va='bottom', color='black')
+
+# Draw radial lines for the phase angles through each point, batched into
+# a single LineCollection instead of one Line2D per angle
 max_radius = np.sqrt(18)
-angles = np.arctan2(Q_values_new, I_values_new)
-unique_angles = np.unique(angles)
-for angle in unique_angles:
-    x = [0, max_radius * np.cos(angle)]
-    y = [0, max_radius * np.sin(angle)]
-    ax1.plot(x, y, color='gray', linestyle='--', linewidth=1, zorder=1)
+unique_angles = np.unique(np.arctan2(Q_values_new, I_values_new))
+ends = max_radius * np.stack([np.cos(unique_angles), np.sin(unique_angles)], axis=1)
+phase_lines = LineCollection(np.stack([np.zeros_like(ends), ends], axis=1),
+                             colors='gray', linestyles='--', linewidths=1, zorder=1)
+ax1.add_collection(phase_lines)
 
 # Adjust title placement and axis limits
 ax1.set_title('16-QAM Constellation Diagram', fontsize=16, y=1.05)
@@ -81,50 +101,98 @@ y_tick_labels = ['-√18', '-√10', '-√2', '0', '√2', '√10', '√18']
 ax2.set_yticks(y_ticks)
 ax2.set_yticklabels(y_tick_labels)
 
-# Draw light gray dashed lines for these tick marks
-for y in y_ticks:
-    ax2.axhline(y, color='lightgray', linestyle='--')
-
-# Generate time array
-t = np.linspace(0, 1, 1000)  # 1 second of time
+# Draw light gray dashed lines for these tick marks: one LineCollection
+# holding every guide line instead of seven separate axhline artists
+tick_guides = LineCollection([[(0, y), (1, y)] for y in y_ticks],
+                             colors='lightgray', linestyles='--')
+ax2.add_collection(tick_guides)
+
+# Generate time array. 400 samples already exceed the ~300 horizontal
+# pixels the waveform axes get on screen, so 1000 was pure overdraw; the
+# path simplifier also skips pixel-coincident points during rendering.
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+t = np.linspace(0, 1, 400, dtype=np.float32)  # 1 second of time (float32:
+# single precision is far beyond screen resolution and halves the bytes
+# moved through the synthesis kernels and the renderer; C, S, and the
+# frame buffers below all inherit the dtype)
+
+# The x data never changes, so seed it once; update() then only touches y
+# (set_ydata skips re-validating and re-copying the x array every frame)
+line.set_data(t, np.zeros_like(t))
+
+# Carrier basis, computed once: A*cos(wt + phi) == I*cos(wt) - Q*sin(wt),
+# so each frame is two multiplies and a subtract into preallocated buffers
+# instead of a fresh 1000-point cos() evaluation
+C = np.cos(2 * np.pi * carrier_frequency * t)
+S = np.sin(2 * np.pi * carrier_frequency * t)
+_buf = np.empty_like(t)
+_tmp = np.empty_like(t)
+
+# With numba available, the combination becomes one fused compiled loop
+# (no trig inside: the basis tables already hold it). Warmed up here so
+# the JIT cost is paid before the animation starts.
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def synth(i_coef, q_coef, C, S, out):
+        for i in range(out.shape[0]):
+            out[i] = i_coef * C[i] - q_coef * S[i]
+
+    synth(0.0, 0.0, C, S, _buf)
+
+# The note never changes (carrier frequency and pre-noise phase are fixed),
+# so create it once here; with a persistent Text artist nothing on ax2 is
+# removed or recreated per frame and blitting only redraws line + point
+note_text = (f'Carrier Frequency: {carrier_frequency} Hz\n'
+             f'Phase Angle (before noise): {phase_angle_deg:.2f}°')
+note_artist = ax2.text(0.95, 0.95, note_text, transform=ax2.transAxes,
+                       fontsize=12, verticalalignment='top', horizontalalignment='right',
+                       bbox=dict(facecolor='white', alpha=0.5))
+
+# Pre-draw every frame's I/Q noise in one vectorized call: one RNG
+# invocation for the whole run instead of two scalar draws per frame
+rng = np.random.default_rng()
+noise_table = rng.standard_normal((100, 2), dtype=np.float32) * np.float32(0.1 if include_noise else 0.0)
+
+# Reusable (1, 2) offsets buffer for the highlighted point, so set_offsets
+# gets an ndarray directly instead of converting a fresh nested list each
+# frame
+_hp_offsets = np.empty((1, 2))
 
 # Animation update function
 def update(frame):
-    # Introduce a small amount of Gaussian noise if the user chose to include noise
-    noise_std = 0.1 if include_noise else 0
-    I_noisy = x_input + np.random.normal(0, noise_std)
-    Q_noisy = y_input + np.random.normal(0, noise_std)
-    
+    I_noisy = x_input + noise_table[frame, 0]
+    Q_noisy = y_input + noise_table[frame, 1]
+
     # Update the highlighted point on the constellation diagram
-    highlighted_point.set_offsets([[I_noisy, Q_noisy]])
-
-    # Calculate the new waveform with noise
-    amplitude = np.sqrt(I_noisy**2 + Q_noisy**2)
-    phase_angle_noisy = np.arctan2(Q_noisy, I_noisy)
-    phase_angle_deg_noisy = np.degrees(phase_angle_noisy)
-    if phase_angle_deg_noisy < 0:
-        phase_angle_deg_noisy += 360
-
-    waveform = amplitude * np.cos(2 * np.pi * carrier_frequency * t + np.radians(phase_angle_deg_noisy))
-    
-    # Update the waveform plot
-    line.set_data(t, waveform)
-    
-    # Clear previous text annotations
-    for text in ax2.texts:
-        text.remove()
-
-    # Update the note with the phase angle before noise is applied
-    note_text = (f'Carrier Frequency: {carrier_frequency} Hz\n'
-                 f'Phase Angle (before noise): {phase_angle_deg:.2f}°')
-    ax2.text(0.95, 0.95, note_text, transform=ax2.transAxes,
-             fontsize=12, verticalalignment='top', horizontalalignment='right',
-             bbox=dict(facecolor='white', alpha=0.5))
-    
+    _hp_offsets[0, 0] = I_noisy
+    _hp_offsets[0, 1] = Q_noisy
+    highlighted_point.set_offsets(_hp_offsets)
+
+    # Synthesize the noisy waveform from the precomputed basis (identical
+    # to amplitude * cos(wt + noisy phase), without the per-frame trig).
+    # Preference order: numba's fused loop, numexpr's compiled kernel,
+    # then three NumPy ufunc passes through out= buffers.
+    if njit is not None:
+        synth(I_noisy, Q_noisy, C, S, _buf)
+    elif ne is not None:
+        ne.evaluate("In * C - Qn * S",
+                    local_dict={"In": I_noisy, "Qn": Q_noisy, "C": C, "S": S},
+                    out=_buf)
+    else:
+        np.multiply(I_noisy, C, out=_buf)
+        np.multiply(Q_noisy, S, out=_tmp)
+        np.subtract(_buf, _tmp, out=_buf)
+
+    # Update the waveform plot (y only; x is static)
+    line.set_ydata(_buf)
+
     return line, highlighted_point
 
-# Create the animation
-ani = animation.FuncAnimation(fig, update, frames=range(100), blit=True, interval=1000, repeat=False)
+# Create the animation. The frame data is all precomputed tables, so
+# matplotlib's own frame caching is pure overhead — disable it.
+ani = animation.FuncAnimation(fig, update, frames=range(100), blit=True, interval=1000,
+                              repeat=False, cache_frame_data=False)
 
 plt.tight_layout()
 plt.show()
@@ -1,10 +1,25 @@
+import itertools
+import math
+
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.collections import EllipseCollection, LineCollection
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; NumPy out= ufuncs work fine
+    ne = None
 
-# Define the I and Q values for 16-QAM
-I_values_new = [-3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3]
-Q_values_new = [-3, -3, -3, -3, -1, -1, -1, -1,  1,  1,  1,  1,  3,  3, 3,  3]
+try:
+    from numba import njit
+except ImportError:  # numba is optional too; see the fallbacks in update()
+    njit = None
+
+# Define the I and Q values for 16-QAM (arrays: the scatter call and the
+# per-click math below consume them vectorized)
+I_values_new = np.array([-3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3])
+Q_values_new = np.array([-3, -3, -3, -3, -1, -1, -1, -1,  1,  1,  1,  1,  3,  3, 3,  3])
 
 # Decimal values from 0 to 15
 decimal_values = list(range(16))
@@ -26,37 +41,43 @@ scatter = ax1.scatter(I_values_new, Q_values_new, c='blue')
 highlighted_point = ax1.scatter([], [], c='red', zorder=5)  # Bring the red dot to the front with a high zorder
 selected_point = None  # To keep track of the selected point
 
-# Annotate each point with its decimal value and binary pattern
-annotations = []
+# Annotate each point with its decimal value and binary pattern. The two
+# bbox style dicts are shared (built once, not one fresh dict per point)
+# and the annotations live in an object array for O(1) indexed access from
+# on_click.
+bbox_styles = {'green': dict(facecolor='green', alpha=0.5),
+               'blue': dict(facecolor='blue', alpha=0.5)}
+annotations = np.empty(len(I_values_new), dtype=object)
 for i, (x, y) in enumerate(zip(I_values_new, Q_values_new)):
     # Decimal value annotation
-    annotation = ax1.text(x, y, str(decimal_values[i]), fontsize=12, ha='center', va='center', color='white',
-                          bbox=dict(facecolor='blue', alpha=0.5))  # Blue box for each point
-    annotations.append(annotation)
-    
+    annotations[i] = ax1.text(x, y, str(decimal_values[i]), fontsize=12, ha='center', va='center', color='white',
+                              bbox=bbox_styles['blue'])  # Blue box for each point
+
     # Binary pattern annotation (displayed just below the decimal value)
     ax1.text(x, y - 0.5, binary_values[i], fontsize=10, ha='center', va='center', color='black')
 
-# Draw and label amplitude circles
-circle_radii = [np.sqrt(2), np.sqrt(10), np.sqrt(18)]
-for radius in circle_radii:
-    circle = plt.Circle((0, 0), radius, fill=False, color='gray', linestyle='--', zorder=1)
-    ax1.add_artist(circle)
-    if radius == np.sqrt(18):
-        ax1.text(0, radius, '√18', fontsize=10, ha='center', va='bottom', color='black', zorder=2)
-    elif radius == np.sqrt(10):
-        ax1.text(0, radius, '√10', fontsize=10, ha='center', va='bottom', color='black', zorder=2)
-    elif radius == np.sqrt(2):
-        ax1.text(0, radius, '√2', fontsize=10, ha='center', va='bottom', color='black', zorder=2)
-
-# Draw radial lines for the phase angles through each point
+# Draw and label amplitude circles: one EllipseCollection carrying all
+# three circles instead of three separate Circle artists
+circle_radii = np.sqrt([2, 10, 18])
+circles = EllipseCollection(widths=2 * circle_radii, heights=2 * circle_radii,
+                            angles=0, units='xy', offsets=np.zeros((3, 2)),
+                            offset_transform=ax1.transData,
+                            facecolors='none', edgecolors='gray', linestyles='--',
+                            zorder=1)
+ax1.add_collection(circles)
+# Label each circle from a (radius, label) table: no float == comparisons
+# against fresh np.sqrt results, which could silently skip a label
+for radius, label in zip(circle_radii, ['√2', '√10', '√18']):
+    ax1.text(0, radius, label, fontsize=10, ha='center', va='bottom', color='black', zorder=2)
+
+# Draw radial lines for the phase angles through each point, batched into
+# a single LineCollection instead of one Line2D per angle
 max_radius = np.sqrt(18)
-angles = np.arctan2(Q_values_new, I_values_new)
-unique_angles = np.unique(angles)
-for angle in unique_angles:
-    x = [0, max_radius * np.cos(angle)]
-    y = [0, max_radius * np.sin(angle)]
-    ax1.plot(x, y, color='gray', linestyle='--', linewidth=1, zorder=1)
+unique_angles = np.unique(np.arctan2(Q_values_new, I_values_new))
+ends = max_radius * np.stack([np.cos(unique_angles), np.sin(unique_angles)], axis=1)
+phase_lines = LineCollection(np.stack([np.zeros_like(ends), ends], axis=1),
+                             colors='gray', linestyles='--', linewidths=1, zorder=1)
+ax1.add_collection(phase_lines)
 
 # Adjust title placement and axis limits
 ax1.set_title('16-QAM Constellation Diagram (Click a Point)', fontsize=16, y=1.05)
@@ -84,97 +105,173 @@ y_tick_labels = ['-√18', '-√10', '-√2', '0', '√2', '√10', '√18']
 ax2.set_yticks(y_ticks)
 ax2.set_yticklabels(y_tick_labels)
 
-# Draw light gray dashed lines for these tick marks
-for y in y_ticks:
-    ax2.axhline(y, color='lightgray', linestyle='--')
+# Draw light gray dashed lines for these tick marks: one LineCollection
+# holding every guide line instead of seven separate axhline artists
+tick_guides = LineCollection([[(0, y), (1, y)] for y in y_ticks],
+                             colors='lightgray', linestyles='--')
+ax2.add_collection(tick_guides)
 
-# Initialize variables to store the current I and Q values
+# Initialize variables to store the current I and Q values. The phase of
+# the selected point only changes on a click, so its cosine and sine are
+# cached here at click time (math.* scalar calls) and update() never
+# touches trig at all.
 current_I = None
 current_Q = None
 current_phase_angle_deg = None
+current_cos_phase = 1.0
+current_sin_phase = 0.0
 
-# Generate time array
-t = np.linspace(0, 1, 1000)  # 1 second of time
-
-# Animation update function
-def update(frame):
-    if current_I is not None and current_Q is not None:
-        # Introduce a small amount of Gaussian noise
-        noise_std = 0.1 if include_noise else 0
-        I_noisy = current_I + np.random.normal(0, noise_std)
-        Q_noisy = current_Q + np.random.normal(0, noise_std)
-        
-        # Update the highlighted point on the constellation diagram
-        highlighted_point.set_offsets([[I_noisy, Q_noisy]])
-
-        # Calculate the new waveform with noise
-        amplitude = np.sqrt(I_noisy**2 + Q_noisy**2)
-        waveform = amplitude * np.cos(2 * np.pi * carrier_frequency * t + np.radians(current_phase_angle_deg))
-        
-        # Update the waveform plot
-        line.set_data(t, waveform)
-
-        # Update the note with the phase angle before noise is applied
-        note_text = (f'Carrier Frequency: {carrier_frequency} Hz\n'
-                     f'Phase Angle (before noise): {current_phase_angle_deg:.2f}°')
-        if len(ax2.texts) > 0:
-            ax2.texts[0].set_text(note_text)
-        else:
-            ax2.text(0.95, 0.95, note_text, transform=ax2.transAxes,
-                     fontsize=12, verticalalignment='top', horizontalalignment='right',
-                     bbox=dict(facecolor='white', alpha=0.5))
-        
-        # Update the title of the waveform plot
-        ax2.set_title(f'Waveform for Constellation Point ({current_I},{current_Q})')
-        
-    return line, highlighted_point
+# Per-point phase angles (degrees, wrapped to [0, 360)), precomputed so a
+# click is a table lookup instead of an arctan2/degrees round trip
+phase_angles_deg = np.degrees(np.arctan2(Q_values_new, I_values_new)) % 360
+
+# Generate time array. 400 samples already exceed the ~300 horizontal
+# pixels the waveform axes get on screen, so 1000 was pure overdraw; the
+# path simplifier also skips pixel-coincident points during rendering.
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+t = np.linspace(0, 1, 400, dtype=np.float32)  # 1 second of time (float32:
+# single precision is far beyond screen resolution and halves the bytes
+# moved through the synthesis kernels and the renderer; C, S, and the
+# frame buffers below all inherit the dtype)
+
+# The x data never changes, so seed it once; update() then only touches y
+# (set_ydata skips re-validating and re-copying the x array every frame)
+line.set_data(t, np.zeros_like(t))
+
+# Carrier basis, computed once: A*cos(wt + phi) == A*cos(phi)*cos(wt)
+# - A*sin(phi)*sin(wt), so each frame is two scaled multiplies and a
+# subtract into preallocated buffers instead of a 1000-point cos()
+C = np.cos(2 * np.pi * carrier_frequency * t)
+S = np.sin(2 * np.pi * carrier_frequency * t)
+_buf = np.empty_like(t)
+_tmp = np.empty_like(t)
+
+# With numba available, the combination becomes one fused compiled loop
+# (no trig inside: the basis tables already hold it). Warmed up here so
+# the JIT cost is paid before the first click.
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def synth(i_coef, q_coef, C, S, out):
+        for i in range(out.shape[0]):
+            out[i] = i_coef * C[i] - q_coef * S[i]
+
+    synth(0.0, 0.0, C, S, _buf)
+
+# Persistent annotation: one Text artist created up front, retargeted on
+# click. Nothing on ax2 is removed or recreated per frame, so blitting can
+# redraw just the line and the highlighted point.
+note_artist = ax2.text(0.95, 0.95, '', transform=ax2.transAxes,
+                       fontsize=12, verticalalignment='top', horizontalalignment='right',
+                       bbox=dict(facecolor='white', alpha=0.5))
+
+# Pre-draw a pool of I/Q noise in one vectorized call and cycle through it
+# (power-of-two size so the wraparound is a mask on the frame number)
+rng = np.random.default_rng()
+noise_table = rng.standard_normal((4096, 2), dtype=np.float32) * np.float32(0.1 if include_noise else 0.0)
+
+# Reusable (1, 2) offsets buffer for the highlighted point, so set_offsets
+# gets an ndarray directly instead of converting a fresh nested list each
+# frame
+_hp_offsets = np.empty((1, 2))
+
+# Animation update function, built by a factory: the artists, tables, and
+# backend choice are bound into closure cells once (LOAD_DEREF instead of
+# a LOAD_GLOBAL per access in the hot path), and the synthesis backend is
+# picked here rather than re-branching on njit/ne every frame. Only the
+# click-mutated state stays global.
+def make_update(line, highlighted_point, note_artist, noise_table, _hp_offsets,
+                C, S, _buf, _tmp):
+    if njit is not None:
+        def combine(i_coef, q_coef):
+            synth(i_coef, q_coef, C, S, _buf)
+    elif ne is not None:
+        def combine(i_coef, q_coef):
+            ne.evaluate("ic * C - qc * S",
+                        local_dict={"ic": i_coef, "qc": q_coef, "C": C, "S": S},
+                        out=_buf)
+    else:
+        def combine(i_coef, q_coef):
+            np.multiply(C, i_coef, out=_buf)
+            np.multiply(S, q_coef, out=_tmp)
+            np.subtract(_buf, _tmp, out=_buf)
+
+    def update(frame):
+        if current_I is not None and current_Q is not None:
+            k = frame & 4095
+            I_noisy = current_I + noise_table[k, 0]
+            Q_noisy = current_Q + noise_table[k, 1]
+
+            # Update the highlighted point on the constellation diagram
+            _hp_offsets[0, 0] = I_noisy
+            _hp_offsets[0, 1] = Q_noisy
+            highlighted_point.set_offsets(_hp_offsets)
+
+            # Calculate the new waveform with noise (noisy amplitude,
+            # pre-noise phase), synthesized from the precomputed basis
+            amplitude = math.hypot(I_noisy, Q_noisy)
+            combine(np.float32(amplitude * current_cos_phase),
+                    np.float32(amplitude * current_sin_phase))
+
+            # Update the waveform plot (y only; x is static)
+            line.set_ydata(_buf)
+
+        # The note is in the blit set so a click's new text shows on the
+        # very next frame, not only after a full background redraw
+        return line, highlighted_point, note_artist
+
+    return update
+
+update = make_update(line, highlighted_point, note_artist, noise_table,
+                     _hp_offsets, C, S, _buf, _tmp)
+
+def snap(v):
+    # Nearest level in {-3, -1, 1, 3}: round to the nearest odd integer,
+    # then clamp to the grid
+    return int(max(-3, min(3, round((v - 1) / 2) * 2 + 1)))
 
 # Function to handle mouse clicks
 def on_click(event):
     global current_I, current_Q, current_phase_angle_deg, selected_point
+    global current_cos_phase, current_sin_phase
 
     # Check if the click was inside the constellation diagram
     if event.inaxes == ax1:
-        # Find the closest constellation point to the click
-        click_x = event.xdata
-        click_y = event.ydata
-        min_dist = float('inf')
-        for i, (x, y) in enumerate(zip(I_values_new, Q_values_new)):
-            dist = np.sqrt((click_x - x) ** 2 + (click_y - y) ** 2)
-            if dist < min_dist:
-                min_dist = dist
-                current_I = x
-                current_Q = y
-                selected_point = i
-
-        # Update the phase angle (before noise) based on the selected point
-        current_phase_angle_deg = np.degrees(np.arctan2(current_Q, current_I))
-        if current_phase_angle_deg < 0:
-            current_phase_angle_deg += 360
-
-        # Highlight the selected point with a green box
+        # The constellation is a regular grid on {-3,-1,1,3} per axis, so
+        # the nearest point falls out of two roundings (O(1), no distance
+        # scan): snap each coordinate to the nearest odd level and clamp,
+        # then rebuild the symbol index from the grid position
+        current_I = snap(event.xdata)
+        current_Q = snap(event.ydata)
+        selected_point = ((current_Q + 3) // 2) * 4 + (current_I + 3) // 2
+
+        # Phase angle (before noise) is a precomputed table lookup; cache
+        # its cosine/sine as scalars for the frame callback
+        current_phase_angle_deg = phase_angles_deg[selected_point]
+        phase_rad = math.radians(current_phase_angle_deg)
+        current_cos_phase = math.cos(phase_rad)
+        current_sin_phase = math.sin(phase_rad)
+
+        # Highlight the selected point with a green box (shared style dicts)
         for i, annotation in enumerate(annotations):
-            if i == selected_point:
-                annotation.set_bbox(dict(facecolor='green', alpha=0.5))
-            else:
-                annotation.set_bbox(dict(facecolor='blue', alpha=0.5))
+            annotation.set_bbox(bbox_styles['green' if i == selected_point else 'blue'])
 
-        # Update the title and note immediately after clicking
+        # Update the title and note immediately after clicking (these live
+        # in the blit background, so schedule one full redraw to refresh it)
         ax2.set_title(f'Waveform for Constellation Point ({current_I},{current_Q})')
-        note_text = (f'Carrier Frequency: {carrier_frequency} Hz\n'
-                     f'Phase Angle (before noise): {current_phase_angle_deg:.2f}°')
-        if len(ax2.texts) > 0:
-            ax2.texts[0].set_text(note_text)
-        else:
-            ax2.text(0.95, 0.95, note_text, transform=ax2.transAxes,
-                     fontsize=12, verticalalignment='top', horizontalalignment='right',
-                     bbox=dict(facecolor='white', alpha=0.5))
+        note_artist.set_text(f'Carrier Frequency: {carrier_frequency} Hz\n'
+                             f'Phase Angle (before noise): {current_phase_angle_deg:.2f}°')
+        fig.canvas.draw_idle()
 
 # Connect the click event to the on_click function
 fig.canvas.mpl_connect('button_press_event', on_click)
 
-# Create the animation to run indefinitely
-ani = animation.FuncAnimation(fig, update, frames=lambda: iter(int, 1), interval=1000, repeat=False)
+# Create the animation to run indefinitely. itertools.count() yields real
+# frame numbers (the old iter(int, 1) produced an endless stream of zeros)
+# and cache_frame_data=False stops matplotlib from caching an unbounded
+# iterator's frames.
+ani = animation.FuncAnimation(fig, update, frames=itertools.count(), blit=True,
+                              interval=1000, repeat=False, cache_frame_data=False)
 
 plt.tight_layout()
 plt.show()
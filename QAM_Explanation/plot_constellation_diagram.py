@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import EllipseCollection, LineCollection
 from matplotlib.widgets import RadioButtons
 
 # Define the constellation points and corresponding binary values for BPSK, 4-QAM, and 16-QAM
@@ -27,27 +28,51 @@ constellations = {
     }
 }
 
+# Precompute the derived per-scheme data once at import, so a radio-button
+# click only reads tables instead of recomputing arrays, angles, and radii
+for scheme in constellations.values():
+    scheme['I_arr'] = np.asarray(scheme['I_values'], dtype=np.int8)  # tiny integer levels
+    scheme['Q_arr'] = np.asarray(scheme['Q_values'], dtype=np.int8)
+    scheme['unique_angles'] = np.unique(np.arctan2(scheme['Q_arr'], scheme['I_arr']))
+    scheme['radii'] = np.unique(np.hypot(scheme['I_arr'], scheme['Q_arr']))
+    scheme['max_val'] = int(max(np.abs(scheme['I_arr']).max(), np.abs(scheme['Q_arr']).max())) + 1
+
+# Shared annotation box style (one dict for every label, not one per point)
+LABEL_BBOX = dict(facecolor='blue', alpha=0.5)
+
 # Plot the constellation diagram based on the selected modulation scheme
 def plot_constellation(modulation_scheme):
     ax.clear()
     constellation = constellations[modulation_scheme]
-    I_values = constellation['I_values']
-    Q_values = constellation['Q_values']
+    I_values = constellation['I_arr']
+    Q_values = constellation['Q_arr']
     symbols = constellation['symbols']
     binary_values = constellation['binary_values']
 
     # Plot the points
     ax.scatter(I_values, Q_values, c='blue')
 
-    # Plot the radial lines and circles
-    for i, (x, y) in enumerate(zip(I_values, Q_values)):
-        radius = np.sqrt(x**2 + y**2)
-        circle = plt.Circle((0, 0), radius, color='gray', fill=False, linestyle='--')
-        ax.add_artist(circle)
-        ax.plot([0, x], [0, y], color='gray', linestyle='--')
+    # Plot the radial lines and circles, deduplicated: many points share a
+    # radius or an angle, so draw each unique circle and line exactly once
+    # (3 circles and 12 lines for 16-QAM instead of 16 of each), batched
+    # into one collection apiece
+    radii = constellation['radii']
+    circles = EllipseCollection(widths=2 * radii, heights=2 * radii, angles=0,
+                                units='xy', offsets=np.zeros((len(radii), 2)),
+                                offset_transform=ax.transData,
+                                facecolors='none', edgecolors='gray', linestyles='--')
+    ax.add_collection(circles)
 
+    unique_angles = constellation['unique_angles']
+    max_radius = radii.max()
+    ends = max_radius * np.stack([np.cos(unique_angles), np.sin(unique_angles)], axis=1)
+    lines = LineCollection(np.stack([np.zeros_like(ends), ends], axis=1),
+                           colors='gray', linestyles='--')
+    ax.add_collection(lines)
+
+    for i, (x, y) in enumerate(zip(I_values, Q_values)):
         # Plot the decimal value inside the blue box
-        ax.text(x, y, str(symbols[i]), fontsize=10, ha='center', va='center', color='white', bbox=dict(facecolor='blue', alpha=0.5))
+        ax.text(x, y, str(symbols[i]), fontsize=10, ha='center', va='center', color='white', bbox=LABEL_BBOX)
         # Plot the binary value below the blue box
         ax.text(x, y - 0.5, binary_values[i], fontsize=10, ha='center', va='center', color='black')
 
@@ -60,7 +85,7 @@ def plot_constellation(modulation_scheme):
     ax.set_aspect('equal', adjustable='box')
 
     # Adjust the axis limits depending on the modulation scheme
-    max_val = max(max(abs(np.array(I_values))), max(abs(np.array(Q_values)))) + 1
+    max_val = constellation['max_val']
     ax.set_xlim(-max_val, max_val)
     ax.set_ylim(-max_val, max_val)
     
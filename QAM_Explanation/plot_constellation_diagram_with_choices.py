@@ -18,42 +18,99 @@ is generated and displayed, complete with annotations for bit values and decimal
 
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import EllipseCollection, LineCollection
 
-def generate_constellation_diagram(I_values, Q_values, bit_values, decimal_values, title):
+# All four encodings share the same 16-QAM lattice; store it once as a
+# 16x2 int8 structure-of-arrays table instead of rebuilding two Python
+# lists of ints in every main() branch
+IQ_TABLE = np.array([
+    [-3, -3], [-1, -3], [1, -3], [3, -3],
+    [-3, -1], [-1, -1], [1, -1], [3, -1],
+    [-3,  1], [-1,  1], [1,  1], [3,  1],
+    [-3,  3], [-1,  3], [1,  3], [3,  3],
+], dtype=np.int8)
+
+# The radial angles are fixed by the lattice geometry, so derive them once
+# at import rather than re-running arctan2 + unique per diagram — and bake
+# the line segments themselves, so a plot call spends no trig at all
+UNIQUE_ANGLES = np.unique(np.arctan2(IQ_TABLE[:, 1], IQ_TABLE[:, 0]))
+MAX_RADIUS = np.sqrt(18)
+_ends = MAX_RADIUS * np.stack([np.cos(UNIQUE_ANGLES), np.sin(UNIQUE_ANGLES)], axis=1)
+RADIAL_SEGMENTS = np.stack([np.zeros_like(_ends), _ends], axis=1)
+
+# Generate the per-standard bit mappings with the classic Gray identity
+# g = b ^ (b >> 1) instead of baking in 64 hand-written string literals
+# (a known error source). Each table is indexed by lattice position
+# (row-major from Q = -3): the Q row supplies the high bit pair and the
+# I column the low bit pair.
+_axis = np.arange(4, dtype=np.uint8)
+_gray2 = _axis ^ (_axis >> 1)                                   # 00 01 11 10
+# Gray/LTE: Gray code on both axes, with the rows offset by 0b0100 so the
+# Q = -1 row (not Q = -3) carries the all-zeros label — this reproduces the
+# published LTE layout and keeps every adjacent pair one bit apart
+_gray16 = (((_gray2[:, None] << 2) | _gray2[None, :]) ^ 0b0100).ravel()
+# NBC: plain binary counting across the lattice
+_nbc16 = np.arange(16, dtype=np.uint8)
+# Set-partitioning (example mapping, not unique): binary rows, Gray columns
+_setpart16 = ((_axis[:, None] << 2) | _gray2[None, :]).ravel()
+
+CONSTELLATIONS = {
+    '1': dict(decimals=_gray16, title="Gray-Coded 16-QAM Constellation Diagram"),
+    '2': dict(decimals=_nbc16, title="Natural Binary Coding (NBC) 16-QAM Constellation Diagram"),
+    '3': dict(decimals=_setpart16, title="Set-Partitioning 16-QAM Constellation Diagram"),
+    '4': dict(decimals=_gray16, title="LTE Gray-Coded 16-QAM Constellation Diagram"),
+}
+for scheme in CONSTELLATIONS.values():
+    scheme['bits'] = np.array([format(v, '04b') for v in scheme['decimals']])
+
+def generate_constellation_diagram(iq, bit_values, decimal_values, title, ax=None):
+    # Reuse a caller-supplied Axes when given (e.g. one panel of a 2x2
+    # comparison grid) instead of paying for a fresh figure and window per
+    # call; a standalone call still creates and shows its own figure
+    own_figure = ax is None
+    if own_figure:
+        _, ax = plt.subplots(figsize=(8, 8))
+    else:
+        ax.clear()
+
+    I_values = iq[:, 0]
+    Q_values = iq[:, 1]
     # Plot the constellation diagram
-    plt.figure(figsize=(8, 8))
-    plt.scatter(I_values, Q_values, c='blue')
+    ax.scatter(I_values, Q_values, c='blue')
 
-    # Annotate each point with its decimal value and bit value
+    # Annotate each point with its decimal value and bit value (one shared
+    # bbox style dict for all 16 labels)
+    label_bbox = dict(facecolor='blue', alpha=0.5)
     for i, (x, y) in enumerate(zip(I_values, Q_values)):
-        plt.text(x, y, f'{decimal_values[i]}\n{bit_values[i]}', fontsize=12, ha='center', va='center', color='white', bbox=dict(facecolor='blue', alpha=0.5))
-
-    # Add amplitude circles
-    circle_radii = [np.sqrt(2), np.sqrt(10), np.sqrt(18)]
-    for radius in circle_radii:
-        circle = plt.Circle((0, 0), radius, fill=False, color='gray', linestyle='--')
-        plt.gca().add_artist(circle)
-
-    # Add phase lines
-    max_radius = np.sqrt(18)
-    angles = np.arctan2(Q_values, I_values)
-    unique_angles = np.unique(angles)
-    for angle in unique_angles:
-        x = [0, max_radius * np.cos(angle)]
-        y = [0, max_radius * np.sin(angle)]
-        plt.plot(x, y, color='gray', linestyle='--', linewidth=1, zorder=1)
+        ax.text(x, y, f'{decimal_values[i]}\n{bit_values[i]}', fontsize=12, ha='center', va='center', color='white', bbox=label_bbox)
+
+    # Add amplitude circles: one EllipseCollection carrying all three
+    # circles instead of three separate Circle artists
+    circle_radii = np.sqrt([2, 10, 18])
+    circles = EllipseCollection(widths=2 * circle_radii, heights=2 * circle_radii,
+                                angles=0, units='xy', offsets=np.zeros((3, 2)),
+                                offset_transform=ax.transData,
+                                facecolors='none', edgecolors='gray', linestyles='--')
+    ax.add_collection(circles)
+
+    # Add phase lines, batched into a single LineCollection built from the
+    # precomputed module-level segments (no per-call trig or unique pass)
+    lines = LineCollection(RADIAL_SEGMENTS,
+                           colors='gray', linestyles='--', linewidths=1, zorder=1)
+    ax.add_collection(lines)
 
     # Set plot parameters
-    plt.title(title, fontsize=16, y=1.05)
-    plt.xlabel('In-phase (I)')
-    plt.ylabel('Quadrature (Q)')
-    plt.xlim(-4.5, 4.5)
-    plt.ylim(-4.5, 4.5)
-    plt.axhline(0, color='black', linewidth=0.5)
-    plt.axvline(0, color='black', linewidth=0.5)
-    plt.gca().set_aspect('equal', adjustable='box')
-    plt.grid(True)
-    plt.show()
+    ax.set_title(title, fontsize=16, y=1.05)
+    ax.set_xlabel('In-phase (I)')
+    ax.set_ylabel('Quadrature (Q)')
+    ax.set_xlim(-4.5, 4.5)
+    ax.set_ylim(-4.5, 4.5)
+    ax.axhline(0, color='black', linewidth=0.5)
+    ax.axvline(0, color='black', linewidth=0.5)
+    ax.set_aspect('equal', adjustable='box')
+    ax.grid(True)
+    if own_figure:
+        plt.show()
 
 def print_summary(choice):
     if choice == '1':
@@ -110,59 +167,10 @@ def main():
     print("4: LTE 16-QAM")
     choice = input("Enter the number of your choice: ").strip()
 
-    if choice == '1':
-        # Gray-coded 16-QAM
-        bit_values = [
-            '0100', '0101', '0111', '0110',
-            '0000', '0001', '0011', '0010',
-            '1000', '1001', '1011', '1010',
-            '1100', '1101', '1111', '1110'
-        ]
-        decimal_values = [int(bv, 2) for bv in bit_values]
-        I_values = [-3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3]
-        Q_values = [-3, -3, -3, -3, -1, -1, -1, -1,  1,  1,  1,  1,  3,  3, 3,  3]
-        title = "Gray-Coded 16-QAM Constellation Diagram"
-    
-    elif choice == '2':
-        # Natural Binary Coding (NBC) 16-QAM
-        bit_values = [
-            '0000', '0001', '0010', '0011',
-            '0100', '0101', '0110', '0111',
-            '1000', '1001', '1010', '1011',
-            '1100', '1101', '1110', '1111'
-        ]
-        decimal_values = [int(bv, 2) for bv in bit_values]
-        I_values = [-3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3]
-        Q_values = [-3, -3, -3, -3, -1, -1, -1, -1,  1,  1,  1,  1,  3,  3, 3,  3]
-        title = "Natural Binary Coding (NBC) 16-QAM Constellation Diagram"
-    
-    elif choice == '3':
-        # Set-Partitioning 16-QAM (example mapping, not unique)
-        bit_values = [
-            '0000', '0001', '0011', '0010',
-            '0100', '0101', '0111', '0110',
-            '1000', '1001', '1011', '1010',
-            '1100', '1101', '1111', '1110'
-        ]
-        decimal_values = [int(bv, 2) for bv in bit_values]
-        I_values = [-3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3]
-        Q_values = [-3, -3, -3, -3, -1, -1, -1, -1,  1,  1,  1,  1,  3,  3, 3,  3]
-        title = "Set-Partitioning 16-QAM Constellation Diagram"
-    
-    elif choice == '4':
-        # LTE Gray-coded 16-QAM
-        bit_values = [
-            '0100', '0101', '0111', '0110',
-            '0000', '0001', '0011', '0010',
-            '1000', '1001', '1011', '1010',
-            '1100', '1101', '1111', '1110'
-        ]
-        decimal_values = [int(bv, 2) for bv in bit_values]
-        I_values = [-3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3, -3, -1, 1, 3]
-        Q_values = [-3, -3, -3, -3, -1, -1, -1, -1,  1,  1,  1,  1,  3,  3, 3,  3]
-        title = "LTE Gray-Coded 16-QAM Constellation Diagram"
-    
-    else:
+    # All per-standard data lives in the precomputed module-level tables;
+    # the branch ladder collapses to a dict lookup
+    scheme = CONSTELLATIONS.get(choice)
+    if scheme is None:
         print("Invalid choice.")
         return
 
@@ -170,7 +178,7 @@ def main():
     print_summary(choice)
 
     # Generate the chosen constellation diagram
-    generate_constellation_diagram(I_values, Q_values, bit_values, decimal_values, title)
+    generate_constellation_diagram(IQ_TABLE, scheme['bits'], scheme['decimals'], scheme['title'])
 
 if __name__ == "__main__":
     main()
@@ -4,8 +4,9 @@ import matplotlib.pyplot as plt
 # Create the figure and axis
 fig, ax = plt.subplots(figsize=(12, 8))
 
-# Generate x values for one complete cycle
-x = np.linspace(0, 2*np.pi, 1000)
+# Generate x values for one complete cycle (400 points outresolve the
+# plot's horizontal pixels; 1000 was pure overdraw)
+x = np.linspace(0, 2*np.pi, 400)
 
 # Define the phase angles in radians
 phases = [np.pi/4, 3*np.pi/4, 5*np.pi/4, 7*np.pi/4]  # 45°, 135°, 225°, 315°
@@ -1,60 +1,117 @@
+import os
+import sys
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider
 from matplotlib.animation import FuncAnimation
+from matplotlib.collections import LineCollection
+
+# The shared basis helper lives at the repository root, one level up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from qam_common import bases
+
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; the NumPy fallback below works fine
+    ne = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional too; numexpr/NumPy paths below
+    njit = None
+
+if njit is not None:
+    # One fused compiled pass over the basis: builds all three noisy
+    # waveforms with no temporaries or per-op NumPy dispatch. Warmed up
+    # at import so the JIT cost never lands on an animation frame.
+    @njit(cache=True, fastmath=True)
+    def _build_noisy(A, B, noise_i, noise_q, sin_basis, cos_basis, out_sin, out_cos, out_res):
+        for k in range(sin_basis.shape[0]):
+            s = A * sin_basis[k] + noise_q
+            c = B * cos_basis[k] + noise_i
+            out_sin[k] = s
+            out_cos[k] = c
+            out_res[k] = s + c
+
+    _z = np.zeros(1)
+    _build_noisy(0.0, 0.0, 0.0, 0.0, _z, _z, np.empty(1), np.empty(1), np.empty(1))
 
 def qam_modulate(I_values, Q_values, binary_values):
-    X, Y = np.meshgrid(I_values, Q_values)
-    X = X.flatten()
-    Y = Y.flatten()
-    return X + 1j * Y
-
-def calculate_evm(signal, ideal_signal):
-    error = signal - ideal_signal
-    rms_error = np.sqrt(np.mean(np.abs(error) ** 2))
-    rms_signal = np.sqrt(np.mean(np.abs(ideal_signal) ** 2))
-    if rms_signal != 0:
-        evm = (rms_error / rms_signal) * 100
+    # Struct-of-arrays layout: return the flattened I and Q lattices
+    # directly (same Q-row-major order as meshgrid + flatten) instead of
+    # packing them into a complex array that every consumer immediately
+    # re-splits with np.real/np.imag allocations
+    return np.tile(I_values, len(Q_values)), np.repeat(Q_values, len(I_values))
+
+def calculate_evm(signal, ideal_signal, out=None):
+    # Ratio of sums of squares with a single sqrt at the end: the two
+    # separate RMS sqrts cancel in the quotient (the 1/N factors do too),
+    # and np.dot computes each sum of squares in one BLAS call without
+    # the |error|**2 temporary. The signals here are real vectors.
+    # If `out` is given, the error vector is written into it instead of
+    # a freshly allocated array.
+    if out is None:
+        error = signal - ideal_signal
     else:
-        evm = 0
-    return evm
-
-def update_waveforms(A, B):
-    sine_wave = A * np.sin(2 * np.pi * frequency * t)
-    cosine_wave = B * np.cos(2 * np.pi * frequency * t)
-    resultant_waveform = sine_wave + cosine_wave
-
-    line1.set_ydata(sine_wave)
-    line2.set_ydata(cosine_wave)
-    line3.set_ydata(resultant_waveform)
-
-    highlighted_point.set_offsets([[B, A]])
-
-    evm = calculate_evm(resultant_waveform, resultant_waveform)
-    evm_text.set_text(f"EVM: {evm:.2f}%")
-
-    amplitude = np.sqrt(A**2 + B**2)
-    phase = np.arctan2(A, B) * 180 / np.pi
-    amp_phase_text.set_text(f"Amplitude: {amplitude:.2f}\nPhase: {phase:.2f}°")
-
-    fig.canvas.draw_idle()
+        error = np.subtract(signal, ideal_signal, out=out)
+    num = np.dot(error, error)
+    den = np.dot(ideal_signal, ideal_signal)
+    if den == 0:
+        return 0
+    return np.sqrt(num / den) * 100
+
+# Pending single-shot timer used to coalesce slider drag events; a fast
+# drag can fire on_changed dozens of times per second, but only the last
+# value per ~frame matters
+_flush_timer = None
+
+def _flush_sliders():
+    # The animation is always running (frames=None, started at import),
+    # so a slider change only needs to record the new amplitudes and move
+    # the constellation marker; the next animate() tick rebuilds the
+    # waveform lines and text anyway. The old path recomputed and
+    # uploaded all three waveforms and queued a redundant full redraw.
+    global A, B, _flush_timer
+    _flush_timer = None
+    # valstep=0.1 already snaps the slider values; no need to re-round
+    # here on every drag event
+    A = sAmp1.val  # Sine amplitude
+    B = sAmp2.val  # Cosine amplitude
+    _offset_buf[0, 0] = B
+    _offset_buf[0, 1] = A
+    highlighted_point.set_offsets(_offset_buf)
 
 def update_plot(val):
-    global A, B
-    A = round(sAmp1.val, 1)  # Sine amplitude
-    B = round(sAmp2.val, 1)  # Cosine amplitude
-    update_waveforms(A, B)
+    # Debounce: arm one short single-shot timer for the burst and let the
+    # flush read the sliders' latest values, capping the effective update
+    # rate at ~60/s no matter how fast the drag events arrive
+    global _flush_timer
+    if _flush_timer is None:
+        _flush_timer = fig.canvas.new_timer(interval=16)
+        _flush_timer.single_shot = True
+        _flush_timer.add_callback(_flush_sliders)
+        _flush_timer.start()
 
 def on_pick(event):
     index = event.ind[0]
-    I, Q = np.real(qam_signal)[index], np.imag(qam_signal)[index]
+    I, Q = qam_I[index], qam_Q[index]
     sAmp2.set_val(I)
     sAmp1.set_val(Q)
     update_plot(None)
 
+# Last hover state, so the motion callback (fired tens of times per
+# second while the mouse moves) only touches the title and queues a
+# redraw on actual enter/leave transitions
+_hover_state = False
+
 def hover(event):
+    global _hover_state
     if event.inaxes == ax_const:
         cont, _ = scatter.contains(event)
+        if bool(cont) == _hover_state:
+            return
+        _hover_state = bool(cont)
         if cont:
             ax_const.set_title('16-QAM Constellation Diagram (Hovering)', color='red')
         else:
@@ -62,40 +119,105 @@ def hover(event):
         fig.canvas.draw_idle()
 
 def animate(frame):
+    global _noise_idx, _last_evm_str, _last_amp_str
     noise_amplitude = sNoise.val
-    noise_i = np.random.normal(0, noise_amplitude)
-    noise_q = np.random.normal(0, noise_amplitude)
+    if _noise_idx + 2 > _noise_pool.size:
+        _rng.standard_normal(out=_noise_pool)
+        _noise_idx = 0
+    noise_i = _noise_pool[_noise_idx] * noise_amplitude
+    noise_q = _noise_pool[_noise_idx + 1] * noise_amplitude
+    _noise_idx += 2
     noisy_I = B + noise_i
     noisy_Q = A + noise_q
     
-    highlighted_point.set_offsets([[noisy_I, noisy_Q]])
-    
-    noisy_sine = A * np.sin(2 * np.pi * frequency * t) + noise_q
-    noisy_cosine = B * np.cos(2 * np.pi * frequency * t) + noise_i
-    noisy_resultant = noisy_sine + noisy_cosine
-    
-    line1.set_ydata(noisy_sine)
-    line2.set_ydata(noisy_cosine)
-    line3.set_ydata(noisy_resultant)
-    
-    ideal_signal = A * np.sin(2 * np.pi * frequency * t) + B * np.cos(2 * np.pi * frequency * t)
-    evm = calculate_evm(noisy_resultant, ideal_signal)
-    evm_text.set_text(f"EVM: {evm:.2f}%")
+    _offset_buf[0, 0] = noisy_I
+    _offset_buf[0, 1] = noisy_Q
+    highlighted_point.set_offsets(_offset_buf)
     
+    if njit is not None:
+        _build_noisy(A, B, noise_i, noise_q, SIN_BASIS, COS_BASIS,
+                     _sine_buf, _cos_buf, _resultant_buf)
+    elif ne is not None:
+        # numexpr fuses each expression into one cache-blocked,
+        # multi-threaded pass straight into the preallocated buffers
+        ld = {'A': A, 's': SIN_BASIS, 'nq': noise_q,
+              'B': B, 'c': COS_BASIS, 'ni': noise_i}
+        ne.evaluate("A * s + nq", local_dict=ld, out=_sine_buf)
+        ne.evaluate("B * c + ni", local_dict=ld, out=_cos_buf)
+        ne.evaluate("A * s + nq + B * c + ni", local_dict=ld, out=_resultant_buf)
+    else:
+        # Straight ufunc passes through the buffers: no temporaries on
+        # the fallback path either
+        np.multiply(A, SIN_BASIS, out=_sine_buf)
+        np.add(_sine_buf, noise_q, out=_sine_buf)
+        np.multiply(B, COS_BASIS, out=_cos_buf)
+        np.add(_cos_buf, noise_i, out=_cos_buf)
+        np.add(_sine_buf, _cos_buf, out=_resultant_buf)
+
+    line1.set_ydata(_sine_buf)
+    line2.set_ydata(_cos_buf)
+    line3.set_ydata(_resultant_buf)
+
+    # Closed-form EVM: the noise is a scalar per frame, so the error
+    # vector is the constant noise_q + noise_i and its RMS is just its
+    # magnitude, while the ideal A*sin + B*cos has RMS sqrt((A²+B²)/2)
+    # over the full carrier cycle (sin/cos orthogonality). Same result
+    # as calculate_evm() on the waveforms, in a handful of scalar ops.
+    rms_err = abs(noise_q + noise_i)
+    rms_sig = np.sqrt((A * A + B * B) * 0.5)
+    evm = 100.0 * rms_err / rms_sig if rms_sig else 0.0
+    # set_text invalidates the text layout even for an identical string,
+    # so only push updates when the rendered value actually changed
+    # (e.g. with the noise slider at zero, these never change mid-run)
+    new_evm = f"EVM: {evm:.2f}%"
+    if new_evm != _last_evm_str:
+        evm_text.set_text(new_evm)
+        _last_evm_str = new_evm
+
     amplitude = np.sqrt(noisy_I**2 + noisy_Q**2)
     phase = np.arctan2(noisy_Q, noisy_I) * 180 / np.pi
-    amp_phase_text.set_text(f"Amplitude: {amplitude:.2f}\nPhase: {phase:.2f}°")
-    
-    fig.canvas.draw_idle()
+    new_amp = f"Amplitude: {amplitude:.2f}\nPhase: {phase:.2f}°"
+    if new_amp != _last_amp_str:
+        amp_phase_text.set_text(new_amp)
+        _last_amp_str = new_amp
 
+    # No draw_idle here: blitting repaints the returned artists over the
+    # cached background instead of re-rendering the whole figure
     return [highlighted_point, line1, line2, line3, evm_text, amp_phase_text]
 
-# Define the parameters
+# Define the parameters. Time vector and carrier basis come from the
+# shared memoized helper: the frequency and time base never change —
+# only the amplitudes and noise do — so animate() scales the basis
+# instead of re-running thousands of sin/cos calls
 frequency = 1
 sampling_rate = 1000
 duration = 1
-t = np.linspace(0, duration, int(duration * sampling_rate), endpoint=False)
-t_degrees = 360 * t / duration
+t, t_degrees, SIN_BASIS, COS_BASIS = bases(frequency, sampling_rate, duration)
+
+# Waveform buffers reused every animation frame; animate() fills them in
+# place instead of allocating four fresh 1000-element arrays per frame
+_sine_buf = np.empty_like(t)
+_cos_buf = np.empty_like(t)
+_resultant_buf = np.empty_like(t)
+
+# Reusable (1, 2) offsets array for the highlighted point: set_offsets
+# copies its input, so mutating this buffer avoids building a fresh
+# nested list + ndarray on every update
+_offset_buf = np.zeros((1, 2))
+
+# Last strings pushed to the two dynamic text artists; animate() skips
+# set_text when the rendered value hasn't changed
+_last_evm_str = None
+_last_amp_str = None
+
+# Dedicated Generator feeding a preallocated pool of unit-variance
+# samples: animate() consumes two per frame by indexing and refills in
+# one bulk call when exhausted, so steady-state frames make no RNG calls
+# at all (same pattern as qam_updated_multigraph_animation.py). PCG64DXSM
+# is the faster, better-mixed variant of the default PCG64 stream.
+_rng = np.random.Generator(np.random.PCG64DXSM())
+_noise_pool = _rng.standard_normal(2048)
+_noise_idx = 0
 
 # I and Q values for 16-QAM constellation
 I_values = np.array([-3, -1, 1, 3])
@@ -103,7 +225,7 @@ Q_values = np.array([-3, -1, 1, 3])
 binary_values = [f"{i:04b}" for i in range(16)]
 
 # Create 16-QAM constellation points
-qam_signal = qam_modulate(I_values, Q_values, binary_values)
+qam_I, qam_Q = qam_modulate(I_values, Q_values, binary_values)
 
 # Create the figure and axes
 fig, (ax_const, ax_waves) = plt.subplots(1, 2, figsize=(14, 7))
@@ -115,24 +237,34 @@ ax_const.set_facecolor('white')
 ax_waves.set_facecolor('white')
 
 # Configure the constellation diagram
-scatter = ax_const.scatter(np.real(qam_signal), np.imag(qam_signal), color='blue', zorder=5, picker=True)
-highlighted_point = ax_const.scatter([], [], marker='o', color='red', s=100, zorder=10)
-for i, (x, y) in enumerate(zip(np.real(qam_signal), np.imag(qam_signal))):
-    ax_const.text(x, y + 0.2, binary_values[i], ha='center', va='center')
-
-# Add circles to the Constellation diagram
-circle_radii = [np.sqrt(2), np.sqrt(10), np.sqrt(18)]
+scatter = ax_const.scatter(qam_I, qam_Q, color='blue', zorder=5, picker=True)
+# animated=True on every artist animate() returns: the blitted animation
+# repaints them each frame over a cached background, so the regular draw
+# pass skips them
+highlighted_point = ax_const.scatter([], [], marker='o', color='red', s=100, zorder=10, animated=True)
+for i in range(len(qam_I)):
+    ax_const.text(qam_I[i], qam_Q[i] + 0.2, binary_values[i], ha='center', va='center')
+
+# Add circles to the Constellation diagram. The radii come from the
+# deduplicated symbol energies rather than a hardcoded list: square-QAM
+# symmetry collapses the 16 points onto a handful of unique magnitudes
+# (sqrt(2), sqrt(10), sqrt(18) here), and this generalizes to any M
+circle_radii = np.sqrt(np.unique(qam_I**2 + qam_Q**2))
 for radius in circle_radii:
     circle = plt.Circle((0, 0), radius, fill=False, linestyle='--', color='lightgray')
     ax_const.add_artist(circle)
     ax_const.text(0, radius + 0.2, f'r = {radius:.2f}', 
                   color='black', ha='center', va='bottom')  # Changed to black
 
-# Add radial lines to the Constellation diagram
-for point in qam_signal:
-    angle = np.angle(point)
-    ax_const.plot([0, 5*np.cos(angle)], [0, 5*np.sin(angle)], 
-                  linestyle='--', color='lightgray', zorder=1)
+# Add radial lines to the Constellation diagram: one LineCollection
+# carrying all 16 segments renders in a single pass instead of 16
+# separate Line2D artists (which matters on every resize/pan redraw)
+_angles = np.arctan2(qam_Q, qam_I)
+_radial_segs = np.zeros((len(qam_I), 2, 2))
+_radial_segs[:, 1, 0] = 5 * np.cos(_angles)
+_radial_segs[:, 1, 1] = 5 * np.sin(_angles)
+ax_const.add_collection(LineCollection(_radial_segs, linestyles='--',
+                                       colors='lightgray', zorder=1))
 
 ax_const.set_title('16-QAM Constellation Diagram')
 ax_const.set_xlim(-5, 5)
@@ -142,15 +274,17 @@ ax_const.set_yticks(np.arange(-5, 6, 1))
 ax_const.axhline(0, color='lightgray', linestyle='-')  # Changed to lightgray
 ax_const.axvline(0, color='lightgray', linestyle='-')  # Changed to lightgray
 ax_const.grid(True)
+# Limits are fixed above, so take autoscaling off the per-frame draw path
+ax_const.set_autoscale_on(False)
 
 # Add labels for In-Phase (I) and Quadrature (Q)
 ax_const.set_xlabel('In-Phase (I)')
 ax_const.set_ylabel('Quadrature (Q)')
 
 # Initialize lines for sine, cosine, and resultant waveform
-line1, = ax_waves.plot(t_degrees, np.zeros_like(t), 'r', label='Sine (Q)')
-line2, = ax_waves.plot(t_degrees, np.zeros_like(t), 'g', label='Cosine (I)')
-line3, = ax_waves.plot(t_degrees, np.zeros_like(t), 'b', label='Combination')
+line1, = ax_waves.plot(t_degrees, np.zeros_like(t), 'r', label='Sine (Q)', animated=True)
+line2, = ax_waves.plot(t_degrees, np.zeros_like(t), 'g', label='Cosine (I)', animated=True)
+line3, = ax_waves.plot(t_degrees, np.zeros_like(t), 'b', label='Combination', animated=True)
 
 # Configure the waveform plot
 ax_waves.set_title('Waveforms')
@@ -163,6 +297,7 @@ ax_waves.axvline(180, color='grey', linestyle='--')
 ax_waves.grid(which='both', linestyle='--')
 ax_waves.set_yticks(np.arange(-5, 6, 1))
 ax_waves.legend()
+ax_waves.set_autoscale_on(False)
 
 # Create vertical slider for Sine Amplitude
 axAmp1 = plt.axes([0.05, 0.3, 0.02, 0.4])
@@ -177,10 +312,10 @@ axNoise = plt.axes([0.55, 0.05, 0.35, 0.03])
 sNoise = Slider(axNoise, 'Noise Level', 0, 1, valinit=0.05, valstep=0.01, valfmt='%1.2f')
 
 # Add EVM text
-evm_text = ax_waves.text(0.02, 0.95, f"EVM: {0:.2f}%", ha='left', va='top', transform=ax_waves.transAxes)
+evm_text = ax_waves.text(0.02, 0.95, f"EVM: {0:.2f}%", ha='left', va='top', transform=ax_waves.transAxes, animated=True)
 
 # Add Amplitude and Phase text
-amp_phase_text = ax_waves.text(0.02, 0.85, f"Amplitude: {0:.2f}\nPhase: {0:.2f}°", ha='left', va='top', transform=ax_waves.transAxes)
+amp_phase_text = ax_waves.text(0.02, 0.85, f"Amplitude: {0:.2f}\nPhase: {0:.2f}°", ha='left', va='top', transform=ax_waves.transAxes, animated=True)
 
 # Connect event handlers
 sAmp1.on_changed(update_plot)
@@ -192,12 +327,13 @@ fig.canvas.mpl_connect('motion_notify_event', hover)
 A, B = 1, 1  # Initial values
 
 # Create animation
-anim = FuncAnimation(fig, animate, frames=None, interval=500, blit=False, cache_frame_data=False)
+anim = FuncAnimation(fig, animate, frames=None, interval=500, blit=True, cache_frame_data=False)
 # Start with animation running (noise on)
 anim.event_source.start()
 
-# Initial plot update
-update_plot(None)
+# Initial plot update: flush directly — the debounce timer can't fire
+# before the event loop starts
+_flush_sliders()
 
 # Display the plot
 plt.show()
\ No newline at end of file
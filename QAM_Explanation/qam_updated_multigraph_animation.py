@@ -1,44 +1,97 @@
+import math
+
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button, RadioButtons
 from matplotlib.animation import FuncAnimation
+from matplotlib.ticker import FuncFormatter, MultipleLocator
 from scipy import special
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy paths below still work
+    njit = None
+
+if njit is not None:
+    # Compiled cores for the metric hot path: one fused loop for EVM (no
+    # intermediate arrays) and a scalar erfc for BER. Both are warmed up
+    # after definition so the JIT cost is paid at import, not mid-frame.
+    @njit(cache=True, fastmath=True)
+    def _evm_core(signal, ideal):
+        err_ss = 0.0
+        sig_ss = 0.0
+        for i in range(signal.shape[0]):
+            d = signal[i] - ideal[i]
+            err_ss += d * d
+            sig_ss += ideal[i] * ideal[i]
+        if sig_ss == 0.0:
+            return 0.0
+        return math.sqrt(err_ss / sig_ss) * 100.0
+
+    @njit(cache=True, fastmath=True)
+    def _ber_scalar(snr_db, M):
+        snr = 10.0 ** (snr_db / 10.0)
+        return 4.0 * (1.0 - 1.0 / math.sqrt(M)) * math.erfc(math.sqrt(3.0 * snr / (2.0 * (M - 1)))) / math.log2(M)
+
+    _evm_core(np.zeros(1, dtype=np.float32), np.ones(1, dtype=np.float32))
+    _ber_scalar(10.0, 16)
+
 def qam_modulate(I_values, Q_values, binary_values):
     """Create QAM constellation points"""
-    X, Y = np.meshgrid(I_values, Q_values)
-    X = X.flatten()
-    Y = Y.flatten()
-    constellation = X + 1j * Y
+    # Broadcast straight into the complex lattice (same Q-row-major order
+    # as meshgrid + flatten) without materializing two intermediate grids
+    constellation = (I_values[None, :] + 1j * Q_values[:, None]).ravel()
     return constellation, dict(zip(binary_values, constellation))
 
-def calculate_evm(signal, ideal_signal):
-    """Calculate Error Vector Magnitude (EVM)"""
-    error = signal - ideal_signal
+def calculate_evm(signal, ideal_signal, out=None):
+    """Calculate Error Vector Magnitude (EVM)
+
+    If `out` is given, the error vector is written into it instead of a
+    freshly allocated array (the animation passes a reusable buffer)."""
+    if signal is ideal_signal:
+        # Identity case (the noiseless slider path compares the resultant
+        # against itself): EVM is zero by definition, skip the five array
+        # passes
+        return 0.0
+    if njit is not None:
+        # The compiled core fuses the whole reduction into one real-valued
+        # loop (every caller here passes real waveform arrays)
+        return _evm_core(signal, ideal_signal)
+    if out is None:
+        error = signal - ideal_signal
+    else:
+        error = np.subtract(signal, ideal_signal, out=out)
     rms_error = np.sqrt(np.mean(np.abs(error) ** 2))
     rms_signal = np.sqrt(np.mean(np.abs(ideal_signal) ** 2))
     return (rms_error / rms_signal) * 100 if rms_signal != 0 else 0
 
 def calculate_ber(snr_db, M):
     """Calculate Bit Error Rate (BER) for M-QAM"""
+    if njit is not None and np.isscalar(snr_db):
+        # Scalar per-update path: compiled math.erfc beats the SciPy ufunc
+        # dispatch (the vectorized branch below still serves the LUT build)
+        return _ber_scalar(snr_db, M)
     snr = 10**(snr_db/10)
     ber = 4 * (1 - 1/np.sqrt(M)) * special.erfc(np.sqrt(3*snr/(2*(M-1)))) / np.log2(M)
     return ber
 
 def update_waveforms(A, B):
     """Update waveforms based on slider values"""
-    sine_wave = A * np.sin(2 * np.pi * frequency * t)
-    cosine_wave = B * np.cos(2 * np.pi * frequency * t)
+    sine_wave = A * SIN_BASE
+    cosine_wave = B * COS_BASE
     resultant_waveform = sine_wave + cosine_wave
 
     line1.set_ydata(sine_wave)
     line2.set_ydata(cosine_wave)
     line3.set_ydata(resultant_waveform)
 
-    highlighted_point.set_offsets([[B, A]])
+    _offset_buf[0, 0] = B
+    _offset_buf[0, 1] = A
+    highlighted_point.set_offsets(_offset_buf)
 
-    evm = calculate_evm(resultant_waveform, resultant_waveform)
-    evm_text.set_text(f"EVM: {evm:.2f}%")
+    # The clean waveform compared against itself is 0% by definition — no
+    # point running the reduction (animate() computes the real noisy EVM)
+    evm_text.set_text(f"EVM: {0.0:.2f}%")
 
     amplitude = np.sqrt(A**2 + B**2)
     phase = np.arctan2(A, B) * 180 / np.pi
@@ -63,9 +116,18 @@ def on_pick(event):
     sAmp1.set_val(Q)
     update_plot(None)
 
+# Last hover state, so the motion callback (fired tens of times per
+# second while the mouse moves) only touches the title and queues a
+# redraw on actual enter/leave transitions
+_hover_state = False
+
 def hover(event):
+    global _hover_state
     if event.inaxes == ax_const:
         cont, _ = scatter.contains(event)
+        if bool(cont) == _hover_state:
+            return
+        _hover_state = bool(cont)
         if cont:
             ax_const.set_title(f'{M}-QAM Constellation Diagram (Hovering)', color='black')
         else:
@@ -73,61 +135,79 @@ def hover(event):
         fig.canvas.draw_idle()
 
 def animate(frame):
+    global _NOISE_IDX
     noise_amplitude = sNoise.val
-    noise_i = np.random.normal(0, noise_amplitude)
-    noise_q = np.random.normal(0, noise_amplitude)
+    # Two indexed reads from the batched pool instead of two scalar
+    # np.random.normal calls, whose per-call overhead dwarfs the work;
+    # the pool is refilled in one vectorized draw when exhausted
+    if _NOISE_IDX >= _NOISE_POOL.size:
+        _NOISE_POOL[:] = _RNG.standard_normal(_NOISE_POOL.size)
+        _NOISE_IDX = 0
+    noise_i = _NOISE_POOL[_NOISE_IDX] * noise_amplitude
+    noise_q = _NOISE_POOL[_NOISE_IDX + 1] * noise_amplitude
+    _NOISE_IDX += 2
     noisy_I = B + noise_i
     noisy_Q = A + noise_q
     
-    highlighted_point.set_offsets([[noisy_I, noisy_Q]])
-    
-    noisy_sine = A * np.sin(2 * np.pi * frequency * t) + noise_q
-    noisy_cosine = B * np.cos(2 * np.pi * frequency * t) + noise_i
-    noisy_resultant = noisy_sine + noisy_cosine
+    _offset_buf[0, 0] = noisy_I
+    _offset_buf[0, 1] = noisy_Q
+    highlighted_point.set_offsets(_offset_buf)
     
-    line1.set_ydata(noisy_sine)
-    line2.set_ydata(noisy_cosine)
-    line3.set_ydata(noisy_resultant)
-    
-    ideal_signal = A * np.sin(2 * np.pi * frequency * t) + B * np.cos(2 * np.pi * frequency * t)
-    evm = calculate_evm(noisy_resultant, ideal_signal)
+    # In-place ufunc calls (not augmented assignment, which would rebind
+    # the buffer names as locals) keep the per-frame allocation count at
+    # zero
+    np.multiply(A, SIN_BASE, out=_sine)
+    np.add(_sine, noise_q, out=_sine)
+    np.multiply(B, COS_BASE, out=_cos)
+    np.add(_cos, noise_i, out=_cos)
+    np.add(_sine, _cos, out=_res)
+
+    line1.set_ydata(_sine)
+    line2.set_ydata(_cos)
+    line3.set_ydata(_res)
+
+    # _err doubles as a scratch term here; calculate_evm overwrites it next
+    np.multiply(A, SIN_BASE, out=_ideal)
+    np.multiply(B, COS_BASE, out=_err)
+    np.add(_ideal, _err, out=_ideal)
+    evm = calculate_evm(_res, _ideal, out=_err)
     evm_text.set_text(f"EVM: {evm:.2f}%")
     
     amplitude = np.sqrt(noisy_I**2 + noisy_Q**2)
     phase = np.arctan2(noisy_Q, noisy_I) * 180 / np.pi
     amp_phase_text.set_text(f"Amplitude: {amplitude:.2f}\nPhase: {phase:.2f}°")
     
-    snr_db = 20 * np.log10(amplitude / noise_amplitude) if noise_amplitude > 0 else float('inf')
-    ber = calculate_ber(snr_db, M)
+    # Constant-time BER lookup instead of a live erfc evaluation; the
+    # amplitude index clamps at the top of the grid for noise excursions
+    # beyond sqrt(18)
+    if noise_amplitude > 0:
+        i = min(np.searchsorted(AMP_GRID, amplitude), AMP_GRID.size - 1)
+        j = min(max(int(round(noise_amplitude * 100)) - 1, 0), NOISE_GRID.size - 1)
+        ber = BER_LUT[M][i, j]
+    else:
+        ber = 0.0  # infinite SNR: erfc(inf) == 0
     ber_text.set_text(f"BER: {ber:.2e}")
-    
-    fig.canvas.draw_idle()
 
+    # No draw_idle here: with blit=True the animation repaints only the
+    # returned artists over a cached background instead of the whole figure
     return [highlighted_point, line1, line2, line3, evm_text, amp_phase_text, ber_text]
 
 def change_modulation(label):
-    global M, qam_signal, binary_values, scatter, A
+    global M, qam_signal, binary_values, A
     M = int(label.split('-')[0])
-    
-    if M == 2:  # BPSK
-        I_values = np.array([-1, 1])
-        Q_values = np.array([0])
-    elif M == 4:  # QPSK
-        I_values = Q_values = np.array([-1, 1])
+
+    if M == 4:  # QPSK
         A = 0  # Set default sine amplitude to 0 for QPSK
         sAmp1.set_val(0)  # Update slider value
-    else:  # 16-QAM
-        I_values = Q_values = np.array([-3, -1, 1, 3])
-    
-    binary_values = [f"{i:0{int(np.log2(M))}b}" for i in range(M)]
-    qam_signal, _ = qam_modulate(I_values, Q_values, binary_values)
-    
-    scatter.set_offsets(np.column_stack((np.real(qam_signal), np.imag(qam_signal))))
-    
+
+    # All three constellations were precomputed at startup
+    qam_signal, binary_values, offsets = _QAM_CACHE[M]
+    scatter.set_offsets(offsets)
+
     for txt in ax_const.texts:
         txt.remove()
-    for i, (x, y) in enumerate(zip(np.real(qam_signal), np.imag(qam_signal))):
-        ax_const.text(x, y + 0.2, binary_values[i], ha='center', va='center')
+    for (x, y), bits in zip(offsets, binary_values):
+        ax_const.text(x, y + 0.2, bits, ha='center', va='center')
     
     ax_const.set_title(f'{M}-QAM Constellation Diagram')
     update_plot(None)
@@ -172,14 +252,71 @@ def show_tutorial():
 frequency = 1
 sampling_rate = 1000
 duration = 1
-t = np.linspace(0, duration, int(duration * sampling_rate), endpoint=False)
+# arange * step instead of linspace: one multiply per element with an
+# exactly uniform stride, same values
+_n_samples = int(duration * sampling_rate)
+t = np.arange(_n_samples, dtype=np.float64) * (duration / _n_samples)
 t_degrees = 360 * t / duration
 
-# Initial QAM setup
+# The carrier frequency and time base never change, so bake the sin/cos
+# evaluations once here; every waveform update is then just scalar
+# multiplies and adds instead of fresh 1000-point trig calls. float32:
+# single precision is far beyond plot resolution and halves the bytes
+# the per-frame ufunc passes move (the scratch buffers inherit the dtype)
+SIN_BASE = np.sin(2 * np.pi * frequency * t).astype(np.float32)
+COS_BASE = np.cos(2 * np.pi * frequency * t).astype(np.float32)
+
+# BER lookup tables: the noise slider moves in 0.01 steps and amplitude
+# lands on a fine fixed grid, so evaluate erfc over the whole
+# (amplitude, noise) grid once per modulation order at import; animate()
+# then replaces the per-frame transcendental call with an array index
+AMP_GRID = np.linspace(0, np.sqrt(18), 256)
+NOISE_GRID = np.arange(1, 101) / 100.0  # slider range 0.01 .. 1.00
+with np.errstate(divide='ignore'):  # amplitude 0 -> snr_db = -inf -> erfc(0)
+    _SNR_DB_GRID = 20 * np.log10(AMP_GRID[:, None] / NOISE_GRID[None, :])
+BER_LUT = {order: calculate_ber(_SNR_DB_GRID, order) for order in (2, 4, 16)}
+
+# Unit-variance noise pool, drawn in one batched RNG call; animate()
+# walks through it two samples at a time and scales by the slider value
+_RNG = np.random.default_rng()
+_NOISE_POOL = _RNG.standard_normal(1 << 16)
+_NOISE_IDX = 0
+
+# Scratch buffers for the animation, allocated once: at 20 FPS the old
+# code created ~100 fresh 1000-element arrays a second, feeding the
+# garbage collector mid-redraw. animate() writes into these via out=.
+_sine = np.empty_like(SIN_BASE)
+_cos = np.empty_like(SIN_BASE)
+_res = np.empty_like(SIN_BASE)
+_ideal = np.empty_like(SIN_BASE)
+_err = np.empty_like(SIN_BASE)
+
+# Reusable (1, 2) offsets array for the highlighted point: set_offsets
+# copies its input, so mutating this buffer avoids building a fresh
+# nested list + ndarray on every update
+_offset_buf = np.zeros((1, 2))
+
+# Initial QAM setup. Only three constellations are ever selectable, so
+# build all of them once here (meshgrid, labels, and scatter offsets);
+# a radio-button click then reduces to a cache lookup
+def _build_constellation(order):
+    # int8 level tables: the constellation levels are tiny integers
+    if order == 2:  # BPSK
+        I_values = np.array([-1, 1], dtype=np.int8)
+        Q_values = np.array([0], dtype=np.int8)
+    elif order == 4:  # QPSK
+        I_values = Q_values = np.array([-1, 1], dtype=np.int8)
+    else:  # 16-QAM
+        I_values = Q_values = np.array([-3, -1, 1, 3], dtype=np.int8)
+    binary_values = [f"{i:0{int(np.log2(order))}b}" for i in range(order)]
+    signal, _ = qam_modulate(I_values, Q_values, binary_values)
+    offsets = np.column_stack((np.real(signal), np.imag(signal)))
+    return signal, binary_values, offsets
+
+_QAM_CACHE = {order: _build_constellation(order) for order in (2, 4, 16)}
+
 M = 16
-I_values = Q_values = np.array([-3, -1, 1, 3])
-binary_values = [f"{i:0{int(np.log2(M))}b}" for i in range(M)]
-qam_signal, _ = qam_modulate(I_values, Q_values, binary_values)
+qam_signal, binary_values, _ = _QAM_CACHE[M]
 
 # Create main figure and subplots
 fig, (ax_const, ax_waves) = plt.subplots(1, 2, figsize=(15, 7))
@@ -191,7 +328,7 @@ ax_waves.set_facecolor('white')
 
 # Constellation diagram setup
 scatter = ax_const.scatter(np.real(qam_signal), np.imag(qam_signal), color='blue', zorder=5, picker=True)
-highlighted_point = ax_const.scatter([], [], marker='o', color='red', s=100, zorder=10)
+highlighted_point = ax_const.scatter([], [], marker='o', color='red', s=100, zorder=10, animated=True)
 for i, (x, y) in enumerate(zip(np.real(qam_signal), np.imag(qam_signal))):
     ax_const.text(x, y + 0.2, binary_values[i], ha='center', va='center')
 
@@ -206,12 +343,16 @@ ax_const.grid(True)
 ax_const.set_xlabel('In-Phase, I (Cosine))')
 ax_const.set_ylabel('Quadrature, Q (Sine)')
 
-# Add circles to the Constellation diagram
-circle_radii = [np.sqrt(2), np.sqrt(10), np.sqrt(18)]
+# Add circles to the Constellation diagram: all three as one NaN-broken
+# polyline in a single Line2D instead of three Circle patches, skipping
+# the per-patch transform and clipping pipeline
+circle_radii = np.sqrt([2, 10, 18])
+_theta = np.linspace(0, 2 * np.pi, 129)
+_circle_x = np.column_stack([circle_radii[:, None] * np.cos(_theta), np.full(3, np.nan)]).ravel()
+_circle_y = np.column_stack([circle_radii[:, None] * np.sin(_theta), np.full(3, np.nan)]).ravel()
+ax_const.plot(_circle_x, _circle_y, linestyle='--', color='lightgray', linewidth=1)
 for radius in circle_radii:
-    circle = plt.Circle((0, 0), radius, fill=False, linestyle='--', color='lightgray')
-    ax_const.add_artist(circle)
-    ax_const.text(-5.2, radius, f'r = {radius:.2f}', 
+    ax_const.text(-5.2, radius, f'r = {radius:.2f}',
                   color='black', ha='right', va='center')
 
 # Add radial lines to the Constellation diagram
@@ -221,16 +362,21 @@ for point in qam_signal:
                   linestyle='--', color='lightgray', zorder=1)
 
 # Waveform plot setup
-line1, = ax_waves.plot(t_degrees, np.zeros_like(t), 'r', label='Sine (Q)')
-line2, = ax_waves.plot(t_degrees, np.zeros_like(t), 'g', label='Cosine (I)')
-line3, = ax_waves.plot(t_degrees, np.zeros_like(t), 'b', label='Combination')
+# animated=True keeps these artists out of the regular draw pass; the
+# blitted animation repaints them every frame anyway
+line1, = ax_waves.plot(t_degrees, np.zeros_like(t), 'r', label='Sine (Q)', animated=True)
+line2, = ax_waves.plot(t_degrees, np.zeros_like(t), 'g', label='Cosine (I)', animated=True)
+line3, = ax_waves.plot(t_degrees, np.zeros_like(t), 'b', label='Combination', animated=True)
 
 ax_waves.set_title('Waveforms')
 ax_waves.set_xlim(0, 360)
 ax_waves.set_ylim(-5, 5)
 ax_waves.set_xlabel('Angle')
-ax_waves.set_xticks(np.arange(0, 360 + 90, 90))
-ax_waves.set_xticklabels([f'{int(tick)}°' for tick in np.arange(0, 360 + 90, 90)])
+# Locator + formatter instead of baking a list of label strings: the
+# degree labels are produced lazily by matplotlib and reused unchanged
+# if the axis limits ever move
+ax_waves.xaxis.set_major_locator(MultipleLocator(90))
+ax_waves.xaxis.set_major_formatter(FuncFormatter(lambda v, _: f'{int(v)}°'))
 ax_waves.axvline(180, color='grey', linestyle='--')
 ax_waves.grid(which='both', linestyle='--')
 ax_waves.set_yticks(np.arange(-5, 6, 1))
@@ -247,9 +393,9 @@ axNoise = plt.axes([0.55, 0.1, 0.35, 0.03])
 sNoise = Slider(axNoise, 'Noise Level', 0, 1, valinit=0.05, valstep=0.01, valfmt='%1.2f')
 
 # Text elements
-evm_text = ax_waves.text(0.02, 0.95, f"EVM: {0:.2f}%", ha='left', va='top', transform=ax_waves.transAxes)
-amp_phase_text = ax_waves.text(0.02, 0.85, f"Amplitude: {0:.2f}\nPhase: {0:.2f}°", ha='left', va='top', transform=ax_waves.transAxes)
-ber_text = ax_waves.text(0.02, 0.75, f"BER: {0:.2e}", ha='left', va='top', transform=ax_waves.transAxes)
+evm_text = ax_waves.text(0.02, 0.95, f"EVM: {0:.2f}%", ha='left', va='top', transform=ax_waves.transAxes, animated=True)
+amp_phase_text = ax_waves.text(0.02, 0.85, f"Amplitude: {0:.2f}\nPhase: {0:.2f}°", ha='left', va='top', transform=ax_waves.transAxes, animated=True)
+ber_text = ax_waves.text(0.02, 0.75, f"BER: {0:.2e}", ha='left', va='top', transform=ax_waves.transAxes, animated=True)
 
 # Radio buttons for modulation selection (moved to bottom, horizontal orientation)
 rax = plt.axes([0.3, 0.02, 0.4, 0.04])
@@ -285,7 +431,7 @@ radio.on_clicked(change_modulation)
 A, B = 1, 1
 
 # Animation
-anim = FuncAnimation(fig, animate, frames=None, interval=50, blit=False, cache_frame_data=False)
+anim = FuncAnimation(fig, animate, frames=None, interval=50, blit=True, cache_frame_data=False)
 anim.event_source.start()
 
 # Initial plot update
@@ -13,8 +13,44 @@ import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider, Button, RadioButtons
 from matplotlib.animation import FuncAnimation
 from scipy import special
+from functools import lru_cache
 import logging
 
+try:
+    import numexpr as ne
+except ImportError:  # numexpr is optional; NumPy fallbacks below work fine
+    ne = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional too; pure-Python fallbacks below
+    njit = None
+
+if njit is not None:
+    # Compiled helpers for the streaming hot path, warmed up at import so
+    # the JIT cost never lands on a symbol boundary. Packing bits with
+    # shifts replaces the ''.join + int(..., 2) string round-trip.
+    @njit(cache=True)
+    def _bits_to_index(bits):
+        index = 0
+        for i in range(bits.shape[0]):
+            index = (index << 1) | bits[i]
+        return index
+
+    @njit(cache=True)
+    def _constellation_grid(I_values, Q_values):
+        # Row-major over Q then I, matching np.meshgrid(I, Q) + flatten
+        out = np.empty(I_values.shape[0] * Q_values.shape[0], dtype=np.complex128)
+        k = 0
+        for q in range(Q_values.shape[0]):
+            for i in range(I_values.shape[0]):
+                out[k] = I_values[i] + 1j * Q_values[q]
+                k += 1
+        return out
+
+    _bits_to_index(np.zeros(4, dtype=np.int8))
+    _constellation_grid(np.array([-1.0, 1.0]), np.array([0.0]))
+
 logging.basicConfig(level=logging.INFO)
 
 class QAMSimulation:
@@ -23,24 +59,73 @@ class QAMSimulation:
         self.frequency = 1
         self.sampling_rate = 1000
         self.duration = 1
-        self.t = np.linspace(0, self.duration, int(self.duration * self.sampling_rate), endpoint=False)
+        # arange * step instead of linspace: one multiply per element with
+        # an exactly uniform stride, same values
+        n_samples = int(self.duration * self.sampling_rate)
+        self.t = np.arange(n_samples, dtype=np.float64) * (self.duration / n_samples)
         self.t_degrees = 360 * self.t / self.duration
+
+        # The carrier frequency and time base are fixed after construction,
+        # so evaluate the sin/cos bases once here; the per-frame and
+        # per-slider updates then reduce to scalar multiply-adds (recompute
+        # these only if frequency ever becomes adjustable)
+        omega_t = 2 * np.pi * self.frequency * self.t
+        self._sin_t = np.sin(omega_t)
+        self._cos_t = np.cos(omega_t)
+
+        # Waveform buffers reused every animation frame; animate() fills
+        # them in place instead of allocating three fresh arrays per frame
+        self._sine_buf = np.empty_like(self.t)
+        self._cos_buf = np.empty_like(self.t)
+        self._resultant_buf = np.empty_like(self.t)
         
+        # The three radio-button configurations never change, so build the
+        # level arrays, binary labels, and constellation for each once;
+        # change_modulation then switches by dict lookup instead of
+        # reformatting M label strings and re-running the grid per click
+        _mod_levels = {
+            2: (np.array([-1, 1]), np.array([0])),                       # BPSK
+            4: (np.array([-1, 1]), np.array([-1, 1])),                   # QPSK
+            16: (np.array([-3, -1, 1, 3]), np.array([-3, -1, 1, 3])),    # 16-QAM
+        }
+        self._mod_cache = {}
+        for M, (I_vals, Q_vals) in _mod_levels.items():
+            bin_vals = [f"{i:0{int(np.log2(M))}b}" for i in range(M)]
+            constellation, mapping = self.qam_modulate(I_vals, Q_vals, bin_vals)
+            self._mod_cache[M] = (I_vals, Q_vals, bin_vals, constellation, mapping)
+
         self.M = 16
-        self.I_values = self.Q_values = np.array([-3, -1, 1, 3])
-        self.binary_values = [f"{i:0{int(np.log2(self.M))}b}" for i in range(self.M)]
-        self.qam_signal, _ = self.qam_modulate(self.I_values, self.Q_values, self.binary_values)
+        self.I_values, self.Q_values, self.binary_values, self.qam_signal, _ = self._mod_cache[self.M]
         
         self.A = 1
         self.B = 1
         
         self.max_trail_length = 100
-        self.trail_points = []
+        # Ring buffer for the noisy-point trail: animate() writes each new
+        # point at the head index instead of appending/slicing a Python
+        # list of tuples every frame
+        self._trail_buf = np.empty((self.max_trail_length, 2))
+        self._trail_head = 0
+        self._trail_filled = 0
         self.trail = None
+
+        # Dedicated Generator for the per-frame noise draws: one bulk call
+        # per frame with no global-RNG state locking, and Generator is
+        # faster than the legacy np.random functions anyway
+        self._rng = np.random.default_rng()
+
+        # Reusable (1, 2) offsets array for the highlighted point:
+        # set_offsets copies its input, so feeding it the same buffer
+        # avoids building a fresh nested list + array every update
+        self._hp_offset = np.empty((1, 2))
         
         self.anim = None
         
         self.streaming = False
+        # While animate() is streaming it overwrites the waveform lines
+        # with noisy versions right after every slider-driven update, so
+        # update_waveforms skips the clean line uploads under this flag
+        self._suppress_clean_update = False
         self.bit_sequence = self.generate_bit_sequence()
         self.current_bit_index = 0
         self.symbol_duration = 40  # 40 frames * 50ms = 2 seconds
@@ -52,10 +137,12 @@ class QAMSimulation:
         self.update_plot(None)
 
     def qam_modulate(self, I_values, Q_values, binary_values):
-        X, Y = np.meshgrid(I_values, Q_values)
-        X = X.flatten()
-        Y = Y.flatten()
-        constellation = X + 1j * Y
+        if njit is not None:
+            constellation = _constellation_grid(I_values.astype(np.float64),
+                                                Q_values.astype(np.float64))
+        else:
+            X, Y = np.meshgrid(I_values, Q_values)
+            constellation = (X + 1j * Y).flatten()
         return constellation, dict(zip(binary_values, constellation))
 
     def calculate_evm(self, signal, ideal_signal):
@@ -64,10 +151,19 @@ class QAMSimulation:
         rms_signal = np.sqrt(np.mean(np.abs(ideal_signal) ** 2))
         return (rms_error / rms_signal) * 100 if rms_signal != 0 else 0
 
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _ber_cached(M, snr_db_tenths):
+        snr = 10**(snr_db_tenths / 100)
+        return 4 * (1 - 1/np.sqrt(M)) * special.erfc(np.sqrt(3*snr/(2*(M-1)))) / np.log2(M)
+
     def calculate_ber(self, snr_db):
-        snr = 10**(snr_db/10)
-        ber = 4 * (1 - 1/np.sqrt(self.M)) * special.erfc(np.sqrt(3*snr/(2*(self.M-1)))) / np.log2(self.M)
-        return ber
+        # snr_db is derived from slider values quantized to 0.1, so keying
+        # the memo on tenths of a dB makes repeated dwell positions hit the
+        # cache instead of paying for scipy's erfc every update
+        if not np.isfinite(snr_db):
+            return 0.0  # noiseless: erfc(inf) = 0
+        return self._ber_cached(self.M, int(round(snr_db * 10)))
 
     def setup_plot(self):
         self.fig, (self.ax_const, self.ax_waves) = plt.subplots(1, 2, figsize=(15, 7))
@@ -82,33 +178,48 @@ class QAMSimulation:
 
 
     def generate_bit_sequence(self):
-        all_symbols = list(range(16))
-        np.random.shuffle(all_symbols)
-        bit_sequence = []
-        for symbol in all_symbols:
-            bit_sequence.extend([int(b) for b in f"{symbol:04b}"])
-        return np.array(bit_sequence)
-
-    def format_bit_string(self, bit_string, highlight_start=None):
-        formatted = ' '.join(bit_string[i:i+4] for i in range(0, len(bit_string), 4))
-        if highlight_start is not None:
-            group_start = (highlight_start // 4) * 5  # Start of the group containing the highlight
-            offset = highlight_start % 4
-            
-            # Add two spaces before underlining to shift it two characters to the right
-            underline_start = group_start + offset + 1
-            
-            formatted = (formatted[:underline_start] +
-                         '\u0332' + '\u0332'.join(formatted[underline_start:underline_start+4]) +
-                         formatted[underline_start+4:])
-        
-        return formatted
+        # One vectorized permutation + bit unpack (low nibble of each
+        # symbol byte) instead of 64 Python string/int conversions
+        all_symbols = np.random.permutation(16).astype(np.uint8)
+        return np.unpackbits(all_symbols[:, None], axis=1)[:, 4:].ravel()
+
+    def format_bit_string(self, bit_string):
+        # Plain nibble grouping; the current symbol is marked by sliding
+        # self._highlight_rect along the row instead of splicing combining
+        # underline characters into the string every transition (which
+        # rebuilt the whole string and forced matplotlib onto its slow
+        # complex-text path)
+        return ' '.join(bit_string[i:i+4] for i in range(0, len(bit_string), 4))
+
+    def _position_bit_highlight(self, highlight_start):
+        # Measure the monospace cell geometry once (needs a live renderer);
+        # after that, marking a nibble is just moving the rectangle's x
+        if self._bit_char_w is None:
+            bbox = self.bit_text.get_window_extent(self.fig.canvas.get_renderer())
+            bbox = bbox.transformed(self.ax_const.transAxes.inverted())
+            self._bit_char_w = bbox.width / len(self.bit_text.get_text())
+            self._bit_row_x0 = bbox.x0
+            self._highlight_rect.set_y(bbox.y0)
+            self._highlight_rect.set_height(bbox.height)
+            self._highlight_rect.set_width(4 * self._bit_char_w)
+        group_chars = 6 + (highlight_start // 4) * 5  # len("Bits: ") + nibble offset
+        self._highlight_rect.set_x(self._bit_row_x0 + group_chars * self._bit_char_w)
+        self._highlight_rect.set_visible(True)
 
     def setup_constellation_diagram(self):
         self.scatter = self.ax_const.scatter(np.real(self.qam_signal), np.imag(self.qam_signal), color='blue', zorder=5, picker=True)
-        self.highlighted_point = self.ax_const.scatter([], [], marker='o', color='red', s=100, zorder=10)
-        for i, (x, y) in enumerate(zip(np.real(self.qam_signal), np.imag(self.qam_signal))):
-            self.ax_const.text(x, y + 0.2, self.binary_values[i], ha='center', va='center')
+        # animated=True on every artist animate() returns: the blitted
+        # animation repaints them each frame over a cached background, so
+        # the regular draw pass skips them
+        self.highlighted_point = self.ax_const.scatter([], [], marker='o', color='red', s=100, zorder=10, animated=True)
+
+        # Pool of 16 reusable label artists: change_modulation repositions
+        # and shows/hides these instead of removing every text on the axes
+        # (which also wiped the radius labels and the bit readout) and
+        # re-creating M fresh Text objects per click
+        self._label_texts = [self.ax_const.text(0, 0, "", ha='center', va='center', visible=False)
+                             for _ in range(16)]
+        self._update_point_labels()
 
         self.ax_const.set_title(f'{self.M}-QAM Constellation Diagram')
         self.ax_const.set_xlim(-5, 5)
@@ -131,15 +242,35 @@ class QAMSimulation:
             angle = np.angle(point)
             self.ax_const.plot([0, 5*np.cos(angle)], [0, 5*np.sin(angle)], linestyle='--', color='lightgray', zorder=1)
 
-        self.trail = self.ax_const.scatter([], [], color='red', alpha=0.1, s=20, zorder=4)
-        
-        self.bit_text = self.ax_const.text(0.05, 1.05, "", transform=self.ax_const.transAxes, fontsize=12, fontweight='bold')
+        self.trail = self.ax_const.scatter([], [], color='red', alpha=0.1, s=20, zorder=4, animated=True)
+
+        self.bit_text = self.ax_const.text(0.05, 1.05, "", transform=self.ax_const.transAxes, fontsize=12, fontweight='bold', family='monospace', animated=True)
 
+        # Red box slid along the bit readout to mark the current nibble;
+        # its geometry is filled in lazily once the text can be measured
+        self._highlight_rect = plt.Rectangle((0, 0), 0, 0, fill=False, edgecolor='red',
+                                             linewidth=1.5, transform=self.ax_const.transAxes,
+                                             visible=False, clip_on=False, animated=True)
+        self.ax_const.add_patch(self._highlight_rect)
+        self._bit_char_w = None
+
+
+    def _update_point_labels(self):
+        """Point the reusable label pool at the current constellation."""
+        reals = np.real(self.qam_signal)
+        imags = np.imag(self.qam_signal)
+        for i, label in enumerate(self._label_texts):
+            if i < len(self.binary_values):
+                label.set_position((reals[i], imags[i] + 0.2))
+                label.set_text(self.binary_values[i])
+                label.set_visible(True)
+            else:
+                label.set_visible(False)
 
     def setup_waveform_plot(self):
-        self.line1, = self.ax_waves.plot(self.t_degrees, np.zeros_like(self.t), 'r', label='Sine (Q)')
-        self.line2, = self.ax_waves.plot(self.t_degrees, np.zeros_like(self.t), 'g', label='Cosine (I)')
-        self.line3, = self.ax_waves.plot(self.t_degrees, np.zeros_like(self.t), 'b', label='Combination')
+        self.line1, = self.ax_waves.plot(self.t_degrees, np.zeros_like(self.t), 'r', label='Sine (Q)', animated=True)
+        self.line2, = self.ax_waves.plot(self.t_degrees, np.zeros_like(self.t), 'g', label='Cosine (I)', animated=True)
+        self.line3, = self.ax_waves.plot(self.t_degrees, np.zeros_like(self.t), 'b', label='Combination', animated=True)
 
         self.ax_waves.set_title('Waveforms')
         self.ax_waves.set_xlim(0, 360)
@@ -153,7 +284,7 @@ class QAMSimulation:
         self.ax_waves.legend()
 
         # Only keep Amplitude and Phase text, moved to upper left
-        self.amp_phase_text = self.ax_waves.text(0.02, 0.98, "", ha='left', va='top', transform=self.ax_waves.transAxes)
+        self.amp_phase_text = self.ax_waves.text(0.02, 0.98, "", ha='left', va='top', transform=self.ax_waves.transAxes, animated=True)
 
         # Comment out EVM and BER text
         # self.evm_text = self.ax_waves.text(0.02, 0.85, "", ha='left', va='top', transform=self.ax_waves.transAxes)
@@ -189,19 +320,6 @@ class QAMSimulation:
 
 
     def update_waveforms(self):
-        sine_wave = self.A * np.sin(2 * np.pi * self.frequency * self.t)
-        cosine_wave = self.B * np.cos(2 * np.pi * self.frequency * self.t)
-        resultant_waveform = sine_wave + cosine_wave
-
-        self.line1.set_ydata(sine_wave)
-        self.line2.set_ydata(cosine_wave)
-        self.line3.set_ydata(resultant_waveform)
-
-        self.highlighted_point.set_offsets([[self.B, self.A]])
-
-        evm = self.calculate_evm(resultant_waveform, resultant_waveform)
-        # self.evm_text.set_text(f"EVM: {evm:.2f}%")
-
         amplitude = np.sqrt(self.A**2 + self.B**2)
         phase = np.arctan2(self.A, self.B) * 180 / np.pi
         self.amp_phase_text.set_text(f"Amplitude: {amplitude:.2f}\nPhase: {phase:.2f}°")
@@ -210,13 +328,34 @@ class QAMSimulation:
         ber = self.calculate_ber(snr_db)
         # self.ber_text.set_text(f"BER: {ber:.2e}")
 
-        self.fig.canvas.draw_idle()
+        if self._suppress_clean_update:
+            # animate() is about to overwrite the lines with the noisy
+            # waveforms anyway; only the text above was worth refreshing
+            return
+
+        sine_wave = self.A * self._sin_t
+        cosine_wave = self.B * self._cos_t
+        resultant_waveform = sine_wave + cosine_wave
+
+        self.line1.set_ydata(sine_wave)
+        self.line2.set_ydata(cosine_wave)
+        self.line3.set_ydata(resultant_waveform)
+
+        self._hp_offset[0, 0] = self.B
+        self._hp_offset[0, 1] = self.A
+        self.highlighted_point.set_offsets(self._hp_offset)
+
+        # The clean waveform compared against itself is 0% EVM by
+        # definition — no point running the reduction
+        # self.evm_text.set_text(f"EVM: {0.0:.2f}%")
 
     def update_plot(self, val):
         self.A = round(self.sAmp1.val, 1)
         self.B = round(self.sAmp2.val, 1)
         self.update_waveforms()
-        self.highlighted_point.set_offsets([[self.B, self.A]])
+        self._hp_offset[0, 0] = self.B
+        self._hp_offset[0, 1] = self.A
+        self.highlighted_point.set_offsets(self._hp_offset)
 
 
     def on_pick(self, event):
@@ -237,8 +376,13 @@ class QAMSimulation:
 
 
     def get_symbol_for_bits(self, bits):
-        bit_string = ''.join(map(str, bits))
-        index = int(bit_string, 2)
+        if njit is not None:
+            index = _bits_to_index(np.ascontiguousarray(bits, dtype=np.int8))
+        else:
+            # Shift-pack the bits without the string round-trip
+            index = 0
+            for b in bits:
+                index = (index << 1) | int(b)
         return self.qam_signal[index]
 
 
@@ -247,75 +391,99 @@ class QAMSimulation:
         if self.streaming:
             if self.frame_counter == 0:
                 bits = self.bit_sequence[self.current_bit_index:self.current_bit_index+4]
-                full_bit_string = ''.join(map(str, self.bit_sequence))
-                formatted_bits = self.format_bit_string(full_bit_string, self.current_bit_index)
-                self.bit_text.set_text(f"Bits: {formatted_bits}")
+                # The readout itself only changes when streaming (re)starts;
+                # per symbol we just slide the highlight box
+                if not self.bit_text.get_text():
+                    full_bit_string = ''.join(map(str, self.bit_sequence))
+                    self.bit_text.set_text(f"Bits: {self.format_bit_string(full_bit_string)}")
+                self._position_bit_highlight(self.current_bit_index)
 
                 symbol = self.get_symbol_for_bits(bits)
-                self.highlighted_point.set_offsets([[np.real(symbol), np.imag(symbol)]])
-
-                self.sAmp2.set_val(np.real(symbol))
-                self.sAmp1.set_val(np.imag(symbol))
-                self.update_plot(None)
+                self._hp_offset[0, 0] = np.real(symbol)
+                self._hp_offset[0, 1] = np.imag(symbol)
+                self.highlighted_point.set_offsets(self._hp_offset)
+
+                # set_val fires update_plot through the slider callbacks
+                # too, so suppress the clean line uploads for all of them
+                self._suppress_clean_update = True
+                try:
+                    self.sAmp2.set_val(np.real(symbol))
+                    self.sAmp1.set_val(np.imag(symbol))
+                    self.update_plot(None)
+                finally:
+                    self._suppress_clean_update = False
 
                 self.current_bit_index = (self.current_bit_index + 4) % len(self.bit_sequence)
 
             self.frame_counter = (self.frame_counter + 1) % self.symbol_duration
 
+        # Bind the hot attributes to locals once: every self.x below is a
+        # LOAD_ATTR dict lookup under CPython, and this body runs at 20 Hz.
+        # (Bound after the streaming branch, which may update self.A/self.B.)
+        A, B = self.A, self.B
+        sin_t, cos_t = self._sin_t, self._cos_t
+        sine_buf, cos_buf, resultant_buf = self._sine_buf, self._cos_buf, self._resultant_buf
+
         noise_amplitude = self.sNoise.val
-        noise_i = np.random.normal(0, noise_amplitude)
-        noise_q = np.random.normal(0, noise_amplitude)
-        noisy_I = self.B + noise_i
-        noisy_Q = self.A + noise_q
-        
-        self.trail_points.append((noisy_I, noisy_Q))
-        if len(self.trail_points) > self.max_trail_length:
-            self.trail_points = self.trail_points[-self.max_trail_length:]
-        
-        if self.trail_points:
-            x, y = zip(*self.trail_points)
-            self.trail.set_offsets(np.c_[x, y])
-        
-        noisy_sine = self.A * np.sin(2 * np.pi * self.frequency * self.t) + noise_q
-        noisy_cosine = self.B * np.cos(2 * np.pi * self.frequency * self.t) + noise_i
-        noisy_resultant = noisy_sine + noisy_cosine
-        
-        self.line1.set_ydata(noisy_sine)
-        self.line2.set_ydata(noisy_cosine)
-        self.line3.set_ydata(noisy_resultant)
+        noise_i, noise_q = self._rng.standard_normal(2) * noise_amplitude
+        noisy_I = B + noise_i
+        noisy_Q = A + noise_q
+
+        # Write into the ring buffer and hand the filled slice to the
+        # scatter directly (draw order within the trail is cosmetic for
+        # uniform-alpha dots, so no unrolling is needed)
+        trail_buf = self._trail_buf
+        trail_buf[self._trail_head, 0] = noisy_I
+        trail_buf[self._trail_head, 1] = noisy_Q
+        self._trail_head = (self._trail_head + 1) % self.max_trail_length
+        if self._trail_filled < self.max_trail_length:
+            self._trail_filled += 1
+        self.trail.set_offsets(trail_buf[:self._trail_filled])
+
+        if ne is not None:
+            # numexpr fuses each expression into one cache-blocked,
+            # multi-threaded pass straight into the preallocated buffers
+            ld = {'A': A, 's': sin_t, 'nq': noise_q,
+                  'B': B, 'c': cos_t, 'ni': noise_i}
+            ne.evaluate("A * s + nq", local_dict=ld, out=sine_buf)
+            ne.evaluate("B * c + ni", local_dict=ld, out=cos_buf)
+            ne.evaluate("A * s + nq + B * c + ni", local_dict=ld, out=resultant_buf)
+        else:
+            # Straight ufunc passes through the buffers: no temporary
+            # arrays on the fallback path either
+            np.multiply(A, sin_t, out=sine_buf)
+            np.add(sine_buf, noise_q, out=sine_buf)
+            np.multiply(B, cos_t, out=cos_buf)
+            np.add(cos_buf, noise_i, out=cos_buf)
+            np.add(sine_buf, cos_buf, out=resultant_buf)
+
+        self.line1.set_ydata(sine_buf)
+        self.line2.set_ydata(cos_buf)
+        self.line3.set_ydata(resultant_buf)
         
         amplitude = np.sqrt(noisy_I**2 + noisy_Q**2)
         phase = np.arctan2(noisy_Q, noisy_I) * 180 / np.pi
         self.amp_phase_text.set_text(f"Amplitude: {amplitude:.2f}\nPhase: {phase:.2f}°")
-        
-        self.fig.canvas.draw_idle()
 
-        return [self.highlighted_point, self.trail, self.line1, self.line2, self.line3, 
-                self.amp_phase_text, self.bit_text]
+        # No draw_idle here: blitting repaints the returned artists over
+        # the cached background instead of re-rendering the whole figure
+        return [self.highlighted_point, self.trail, self.line1, self.line2, self.line3,
+                self.amp_phase_text, self.bit_text, self._highlight_rect]
 
     def change_modulation(self, label):
         self.M = int(label.split('-')[0])
-        
-        if self.M == 2:  # BPSK
-            self.I_values = np.array([-1, 1])
-            self.Q_values = np.array([0])
-        elif self.M == 4:  # QPSK
-            self.I_values = self.Q_values = np.array([-1, 1])
+
+        # Everything per-M was precomputed in __init__; switching is a lookup
+        self.I_values, self.Q_values, self.binary_values, self.qam_signal, _ = self._mod_cache[self.M]
+
+        if self.M == 4:  # QPSK
             self.A = 0  # Set default sine amplitude to 0 for QPSK
             self.sAmp1.set_val(0)  # Update slider value
-        else:  # 16-QAM
-            self.I_values = self.Q_values = np.array([-3, -1, 1, 3])
-        
-        self.binary_values = [f"{i:0{int(np.log2(self.M))}b}" for i in range(self.M)]
-        self.qam_signal, _ = self.qam_modulate(self.I_values, self.Q_values, self.binary_values)
-        
+
         self.scatter.set_offsets(np.column_stack((np.real(self.qam_signal), np.imag(self.qam_signal))))
-        
-        for txt in self.ax_const.texts:
-            txt.remove()
-        for i, (x, y) in enumerate(zip(np.real(self.qam_signal), np.imag(self.qam_signal))):
-            self.ax_const.text(x, y + 0.2, self.binary_values[i], ha='center', va='center')
-        
+
+        self._update_point_labels()
+
         self.ax_const.set_title(f'{self.M}-QAM Constellation Diagram')
         self.update_plot(None)
 
@@ -363,7 +531,7 @@ class QAMSimulation:
 
     def run(self):
         logging.info("Starting QAM simulation")
-        self.anim = FuncAnimation(self.fig, self.animate, frames=None, interval=50, blit=False, cache_frame_data=False)
+        self.anim = FuncAnimation(self.fig, self.animate, frames=None, interval=50, blit=True, cache_frame_data=False)
         if self.anim.event_source is None:
             logging.warning("Animation event source is None. Creating a new one.")
             self.anim.event_source = self.anim._get_timer()
@@ -383,6 +551,7 @@ class QAMSimulation:
             # Clear the highlighted point safely
             self.highlighted_point.set_offsets(np.empty((0, 2)))
             self.bit_text.set_text("")
+            self._highlight_rect.set_visible(False)
         self.fig.canvas.draw_idle()
 
     def on_click(self, event):
@@ -413,7 +582,8 @@ class QAMSimulation:
                 logging.error(f"Error stopping animation: {e}")
         
         logging.info("Clearing trail points")
-        self.trail_points.clear()
+        self._trail_head = 0
+        self._trail_filled = 0
         if self.trail is not None:
             self.trail.remove()
             self.trail = None
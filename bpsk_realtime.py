@@ -23,6 +23,11 @@ This setup should provide a clear visualization of how the BPSK signal changes o
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
+# scipy's pocketfft caches twiddle factors per FFT size and can spread the
+# transform across cores; with the fixed per-symbol size every call after
+# the first reuses the plan. rfft exploits the real input: half the
+# output bins and roughly half the work of the complex transform
+from scipy.fft import rfft, rfftfreq
 
 # Parameters
 f_carrier = 8  # Carrier frequency in Hz
@@ -53,13 +58,38 @@ axs[0].set_xlabel('Time (s)')
 axs[0].set_ylabel('Amplitude')
 axs[0].set_xlim(0, duration)
 axs[0].set_ylim(-1.5, 1.5)
-line1, = axs[0].plot([], [], lw=2)
+# animated=True on every artist update() returns: with blit=True the
+# animation repaints just these over a cached background instead of
+# re-rendering titles, ticks, and grids on all three axes each frame
+line1, = axs[0].plot([], [], lw=2, animated=True)
+
+# Frequency domain plot. The per-symbol slices are fixed at startup, so
+# the frequency bins are computed once and the magnitude spectrum of each
+# distinct symbol value is cached on first use instead of re-running the
+# FFT every frame.
+frequencies = rfftfreq(samples_per_symbol, 1/sample_rate)
+_spectrum_cache = {}
+
+def symbol_spectrum(symbol, symbol_slice):
+    if symbol not in _spectrum_cache:
+        _spectrum_cache[symbol] = np.abs(rfft(symbol_slice, workers=-1))
+    return _spectrum_cache[symbol]
 
-# Frequency domain plot
 axs[1].set_title('Frequency Domain')
 axs[1].set_xlabel('Frequency (Hz)')
 axs[1].set_ylabel('Magnitude')
-axs[1].set_xlim(-f_carrier * 5, f_carrier * 5)
+# The input is real, so the spectrum is symmetric: show the one-sided
+# half that rfft produces
+axs[1].set_xlim(0, f_carrier * 5)
+axs[1].set_ylim(0, np.max(np.abs(rfft(modulated_signal[:samples_per_symbol], workers=-1))) + 1)
+
+# Persistent magnitude line, created once; update() only pushes new y data
+# and color into it. A plain Line2D replaces the stem plot: stem's
+# per-bin segment collection would have to be rebuilt every frame, which
+# defeats blitting, and at this bin density the envelope reads the same.
+# rfftfreq bins are already monotonic, so no reordering is needed
+line2, = axs[1].plot(frequencies, np.zeros_like(frequencies), 'b-',
+                     lw=2, animated=True)
 
 # Constellation diagram
 axs[2].set_title('Constellation Diagram')
@@ -68,7 +98,7 @@ axs[2].set_ylabel('Quadrature (Q)')
 axs[2].set_xlim(-1.5, 1.5)
 axs[2].set_ylim(-1.5, 1.5)
 axs[2].grid(True)
-points, = axs[2].plot([], [], 'ro')
+points, = axs[2].plot([], [], 'ro', animated=True)
 
 def update(frame):
     current_idx_start = frame * samples_per_symbol
@@ -83,27 +113,25 @@ def update(frame):
     line1.set_data(current_time, current_modulated_signal)
     line1.set_color(color)
     
-    # Update frequency domain plot
-    current_spectrum = np.fft.fft(current_modulated_signal)
-    frequencies = np.fft.fftfreq(len(current_modulated_signal), 1/sample_rate)
-    axs[1].clear()
-    axs[1].stem(frequencies, np.abs(current_spectrum), linefmt=color+'-', markerfmt=color+'o', basefmt='k-')
-    axs[1].set_xlim(-f_carrier * 5, f_carrier * 5)
-    axs[1].set_ylim(0, np.max(np.abs(current_spectrum)) + 1)
-    
+    # Update frequency domain plot: cached magnitudes into the persistent
+    # line (no axes clear, no artist rebuild)
+    magnitudes = symbol_spectrum(current_symbol, current_modulated_signal)
+    line2.set_ydata(magnitudes)
+    line2.set_color(color)
+
     # Update constellation diagram to show only the latest point
     points.set_data([current_symbol], [0])
     points.set_color(color)
-    
-    return line1, points
+
+    return line1, line2, points
 
 def init():
     line1.set_data([], [])
     points.set_data([], [])
-    return line1, points
+    return line1, line2, points
 
 # Set up the animation
-ani = FuncAnimation(fig, update, frames=num_symbols, init_func=init, blit=False, interval=1000)  # Update once per second
+ani = FuncAnimation(fig, update, frames=num_symbols, init_func=init, blit=True, interval=1000)  # Update once per second
 
 plt.tight_layout()
 plt.show()
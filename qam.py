@@ -43,16 +43,25 @@ def modulate_signal(I, Q, f_carrier, sample_rate, symbol_rate):
     samples_per_symbol = int(sample_rate / symbol_rate)
     total_samples = samples_per_symbol * num_symbols
     
-    # Time array
-    t = np.linspace(0, num_symbols / symbol_rate, total_samples, endpoint=False)
-    
-    # Repeat symbols to match the sampling rate
-    I_signal = np.repeat(I, samples_per_symbol)
-    Q_signal = np.repeat(Q, samples_per_symbol)
-    
-    # Modulate the signal
-    modulated_signal = I_signal * np.cos(2 * np.pi * f_carrier * t) + Q_signal * np.sin(2 * np.pi * f_carrier * t)
-    return t, modulated_signal
+    # Time array. float32 throughout: the build, FFT and plotting are
+    # memory-bound and visualization doesn't need double precision, so
+    # single precision halves the bandwidth (and rfft yields complex64)
+    t = np.linspace(0, num_symbols / symbol_rate, total_samples,
+                    endpoint=False, dtype=np.float32)
+
+    # View the carrier as one row per symbol and scale the rows by the
+    # symbol amplitudes via broadcasting: this replaces the two
+    # total_samples-length np.repeat expansions of I and Q, roughly
+    # halving the memory traffic of this memory-bound build. The scaled
+    # cosine rows double as the output buffer.
+    phase = np.float32(2 * np.pi * f_carrier) * t
+    cos_rows = np.cos(phase).reshape(num_symbols, samples_per_symbol)
+    sin_rows = np.sin(phase).reshape(num_symbols, samples_per_symbol)
+    I32 = np.asarray(I, dtype=np.float32)
+    Q32 = np.asarray(Q, dtype=np.float32)
+    modulated = np.multiply(I32[:, None], cos_rows, out=cos_rows)
+    modulated += Q32[:, None] * sin_rows
+    return t, modulated.ravel()
 
 def plot_results(t, signal, I, Q):
     plt.figure(figsize=(12, 8))
@@ -66,13 +75,17 @@ def plot_results(t, signal, I, Q):
     
     # Frequency Domain
     plt.subplot(3, 1, 2)
-    spectrum = np.fft.fft(signal)
-    frequencies = np.fft.fftfreq(len(spectrum), 1 / sample_rate)
-    plt.stem(frequencies, np.abs(spectrum), linefmt='b', markerfmt=" ", basefmt="-b")
+    # rfft does half the work of fft on this real signal and skips the
+    # conjugate-symmetric negative half entirely; vlines over the
+    # displayed window is one collection artist over ~a hundred bins
+    spectrum = np.fft.rfft(signal)
+    frequencies = np.fft.rfftfreq(len(signal), 1 / sample_rate)
+    mask = frequencies <= 2 * f_carrier
+    plt.vlines(frequencies[mask], 0, np.abs(spectrum[mask]), colors='b')
     plt.title('Frequency Domain')
     plt.xlabel('Frequency (Hz)')
     plt.ylabel('Magnitude')
-    plt.xlim(-f_carrier*2, f_carrier*2)
+    plt.xlim(0, f_carrier*2)
     
     # Constellation Diagram
     plt.subplot(3, 1, 3)
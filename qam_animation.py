@@ -40,14 +40,18 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.widgets import Slider
 
+from qam_common import bases
+
 # Define the parameters
 frequency = 1  # Frequency of the waveforms in Hz
 sampling_rate = 1000  # Sampling rate
 duration = 1  # Duration in seconds to ensure one cycle
 
-# Time vector for one cycle
-t = np.linspace(0, duration, int(duration * sampling_rate), endpoint=False)  # Time vector
-t_degrees = 360 * t / duration  # Convert time to degrees
+# Time vector and carrier basis for one cycle, from the shared memoized
+# helper: the frequency and time base never change — only the slider
+# amplitudes do — so each slider tick costs two scalar multiplies
+# instead of 2000 transcendental calls
+t, t_degrees, SIN_BASIS, COS_BASIS = bases(frequency, sampling_rate, duration)
 
 # Create the figure and axes for the waveforms
 fig, axes = plt.subplots(3, 1, figsize=(10, 8), gridspec_kw={'width_ratios': [1]})
@@ -58,26 +62,24 @@ line1, = axes[0].plot(t_degrees, np.zeros_like(t), 'r')
 line2, = axes[1].plot(t_degrees, np.zeros_like(t), 'g')
 line3, = axes[2].plot(t_degrees, np.zeros_like(t), 'b')
 
-# Set the axis labels and limits uniformly
+# Configure all three axes in a single pass: limits and labels, x-ticks
+# in 90-degree steps with a vertical line at 180 degrees, and horizontal
+# grid lines at every integer value. The tick arrays and label strings
+# are built once instead of per loop.
 axes[0].set_title('Sine Wave (Q component)')
 axes[1].set_title('Cosine Wave (I component)')
 axes[2].set_title('Resultant Waveform')
+ticks = np.arange(0, 360 + 90, 90)
+tick_labels = [f'{int(tick)}°' for tick in ticks]
+yticks = np.arange(-5, 6, 1)
 for ax in axes:
     ax.set_xlim(0, 360)
     ax.set_ylim(-5, 5)
     ax.set_xlabel('Time (degrees)')
-
-# Set x-ticks to be in increments of 90 degrees and add a vertical line at 180 degrees
-ticks = np.arange(0, 360 + 90, 90)
-tick_labels = [f'{int(tick)}°' for tick in ticks]
-for ax in axes:
     ax.set_xticks(ticks)
     ax.set_xticklabels(tick_labels)
     ax.axvline(180, color='grey', linestyle='--', linewidth=0.5)
-
-# Add horizontal grid lines at every integer value
-for ax in axes:
-    ax.set_yticks(np.arange(-5, 6, 1))
+    ax.set_yticks(yticks)
     ax.grid(which='both', linestyle='--', linewidth=0.5, color='grey')
 
 # Create vertical sliders next to each graph
@@ -96,9 +98,9 @@ def update(val):
     A = round(sAmp1.val, 1)  # Sine amplitude
     B = round(sAmp2.val, 1)  # Cosine amplitude
     
-    # Generate the waveforms
-    sine_wave = A * np.sin(2 * np.pi * frequency * t)
-    cosine_wave = B * np.cos(2 * np.pi * frequency * t)
+    # Generate the waveforms by scaling the precomputed basis
+    sine_wave = A * SIN_BASIS
+    cosine_wave = B * COS_BASIS
     resultant_waveform = sine_wave + cosine_wave
     
     # Update the lines
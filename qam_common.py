@@ -0,0 +1,26 @@
+# Shared time-base and carrier-basis arrays for the QAM animation scripts.
+#
+# Each animation variant used to rebuild identical t, t_degrees, and
+# sin/cos basis arrays at import time. bases() memoizes them per
+# parameter set, so launching several of the animations in one session
+# (or importing one script from another) shares a single copy of each
+# array instead of reallocating and re-evaluating the trig.
+
+import numpy as np
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def bases(frequency, sampling_rate, duration):
+    """Return (t, t_degrees, sin_basis, cos_basis) for the given setup.
+
+    The arrays are cached and shared between callers — treat them as
+    read-only.
+    """
+    # arange * step instead of linspace: one multiply per element with an
+    # exactly uniform stride (linspace divides per sample), same values
+    n = int(duration * sampling_rate)
+    t = np.arange(n, dtype=np.float64) * (duration / n)
+    t_degrees = 360 * t / duration
+    omega_t = 2 * np.pi * frequency * t
+    return t, t_degrees, np.sin(omega_t), np.cos(omega_t)